@@ -0,0 +1,78 @@
+"""
+Benchmarks the induction-property kernel against the per-repressor loop used
+in `talks/20191206_hallatschek_group_meeting/code/induction_properties.py`.
+
+Run from the repository root with
+
+    python benchmarks/induction_properties.py
+
+A synthetic chain the size of a [::10]-thinned `main_text_KaKi.pkl` is used
+so the benchmark does not depend on the Git LFS data files. If the `phd`
+package is importable, its `SimpleRepression.compute_properties` loop is
+timed as well.
+"""
+import os
+import sys
+import time
+import numpy as np
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from talktools import kernels
+
+N_SAMPLES = 66000
+rep_range = np.logspace(0, 4, 200)
+rng = np.random.default_rng(42)
+ka_chain = np.exp(-rng.normal(-4.9, 0.1, N_SAMPLES))
+ki_chain = np.exp(-rng.normal(0.6, 0.05, N_SAMPLES))
+ep_r = -13.9
+ep_ai = 4.5
+
+
+def timeit(func, repeats=3):
+    """Returns the best wall time of `func` over `repeats` calls."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def per_r_loop():
+    """One vectorized evaluation over the chain per repressor copy number."""
+    out = np.empty((len(kernels.PROPERTIES), 1, N_SAMPLES))
+    ep_ai_chain = np.full(N_SAMPLES, ep_ai)
+    for r in rep_range:
+        kernels._properties_numpy(np.array([r]), ep_r, ka_chain, ki_chain,
+                                  ep_ai_chain, 2, 4.6E6, out)
+        dict(zip(kernels.PROPERTIES, out[:, 0]))
+
+
+def block():
+    """The whole (R x samples) block in one kernel call."""
+    kernels.induction_properties(rep_range, ep_r, ka_chain, ki_chain, ep_ai)
+
+
+if __name__ == '__main__':
+    # Trigger compilation before timing.
+    block()
+    results = {'per-R NumPy loop': timeit(per_r_loop),
+               'block kernel': timeit(block)}
+    try:
+        import phd.thermo
+
+        def phd_loop():
+            for r in rep_range:
+                phd.thermo.SimpleRepression(R=r, ep_r=ep_r, ka=ka_chain,
+                                            ki=ki_chain, ep_ai=ep_ai,
+                                            effector_conc=0
+                                            ).compute_properties()
+        results['phd per-R loop'] = timeit(phd_loop, repeats=1)
+    except ImportError:
+        pass
+
+    backend = 'numba' if kernels.numba is not None else 'numpy'
+    print(f'{len(rep_range)} repressor values x {N_SAMPLES} samples '
+          f'(kernel backend: {backend})')
+    base = results['per-R NumPy loop']
+    for name, t in results.items():
+        print(f'{name:>20s}: {t:8.3f} s  ({base / t:5.1f}x)')
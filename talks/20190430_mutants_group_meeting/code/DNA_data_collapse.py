@@ -1,17 +1,21 @@
 # -*- coding: utf-8 -*-
+import sys
 import numpy as np 
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.legend
 import phd.viz
 import phd.thermo
-constants = phd.thermo.load_constants()
+sys.path.insert(0, '../../../')
+import talktools.constants
+import talktools.data
+constants = talktools.constants.load_constants()
 colors = phd.viz.phd_style()
 
 # Load the data
-data = pd.read_csv('../data/summarized_data.csv')
+data = talktools.data.load_dataset('summarized')
 data = data[data['class']=='DNA'].copy()
-stats = pd.read_csv('../data/DNA_binding_energy_summary.csv')
+stats = talktools.data.load_dataset('DNA_binding_energy_summary')
 stats = stats[stats['repressors']==260].copy()
 
 # Define colors and glyphs
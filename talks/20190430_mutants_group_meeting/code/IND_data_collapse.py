@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import sys
 import numpy as np 
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -6,14 +7,17 @@ import matplotlib.legend
 import phd.viz
 import phd.thermo
 import seaborn as sns
-constants = phd.thermo.load_constants()
+sys.path.insert(0, '../../../')
+import talktools.constants
+import talktools.data
+constants = talktools.constants.load_constants()
 colors = phd.viz.phd_style()
 _colors = sns.color_palette('magma', n_colors=3)
 
 # Load the data
-data = pd.read_csv('../data/summarized_data.csv')
+data = talktools.data.load_dataset('summarized')
 data = data[data['class']=='IND'].copy()
-stats = pd.read_csv('../data/KaKi_epAI_summary.csv')
+stats = talktools.data.load_dataset('KaKi_epAI_summary')
 stats = stats[stats['operator']=='O2'].copy()
 
 # Define colors and glyphs
@@ -1,23 +1,27 @@
 # -*- coding; utf-8 -*- 
+import sys
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import phd.thermo
 import phd.viz
 import seaborn as sns
-constants = phd.thermo.load_constants()
+sys.path.insert(0, '../../../')
+import talktools.constants
+import talktools.data
+constants = talktools.constants.load_constants()
 colors = phd.viz.phd_style()
 _colors = sns.color_palette('magma', n_colors=3)
 # Load and restrict the various data sets
-data = pd.read_csv('../data/summarized_data.csv')
+data = talktools.data.load_dataset('summarized')
 data = data[data['class']=='IND'].copy()
-kaki_only_stats = pd.read_csv('../data/KaKi_only_summary.csv')
+kaki_only_stats = talktools.data.load_dataset('KaKi_only_summary')
 kaki_only_stats = kaki_only_stats[kaki_only_stats['operator']=='O2'].copy()
-kaki_epAI_stats = pd.read_csv('../data/kaki_epAI_summary.csv')
+kaki_epAI_stats = talktools.data.load_dataset('KaKi_epAI_summary')
 kaki_epAI_stats = kaki_epAI_stats[kaki_epAI_stats['operator']=='O2']
-kaki_epAI_samps = pd.read_csv('../data/KaKi_epAI_samples.csv')
+kaki_epAI_samps = talktools.data.load_dataset('KaKi_epAI_samples')
 kaki_epAI_samps = kaki_epAI_samps[kaki_epAI_samps['operator']=='O2'].copy()
-bohr = pd.read_csv('../data/empirical_F_statistics.csv')
+bohr = talktools.data.load_dataset('empirical_F_statistics')
 bohr = bohr[bohr['class']=='IND'].copy()
 
 # Define constants for plotting 
@@ -1,14 +1,17 @@
 # -*- coding: utf-8 -*-
+import sys
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import phd.viz
 import phd.bayes
+sys.path.insert(0, '../../../')
+import talktools.data
 colors = phd.viz.phd_style()
 
 # Load the data and sampling statistics
-data = pd.read_csv('../data/pathological_F_data.csv')
-stats = pd.read_csv('../data/pathological_F_stats.csv')
+data = talktools.data.load_dataset('pathological_F')
+stats = talktools.data.load_dataset('pathological_F_stats')
 stats['draw'] = stats.groupby(['true_bohr']).ngroup()
 
 TRUE_DATA = 1
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import sys
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -6,32 +7,29 @@ import phd.viz
 import phd.thermo
 import phd.stats
 import seaborn as sns
-import pickle
 import imp
+sys.path.insert(0, '../../../')
+import talktools.constants
+import talktools.data
+import talktools.chains
 imp.reload(phd.viz)
 colors = phd.viz.phd_style()
-constants = phd.thermo.load_constants()
+constants = talktools.constants.load_constants()
 
-# Load data and correct names
-data = pd.read_csv('../data/RazoMejia2018_data.csv')
-data = data[data['repressors']> 0].copy()
-data['repressors'] *= 2
-data.rename(columns={'IPTG_uM':'IPTGuM'}, inplace=True)
+# Load the tidied wild-type data
+data = talktools.data.load_dataset('wt_tidy')
 
 # Load the MCMC chains to draw credible regions. 
-with open('../data/main_text_KaKi.pkl', 'rb') as pkl:
-    chain = pickle.load(pkl)
-ka_chain = np.exp(-chain[:, 0])[::10]
-ki_chain = np.exp(-chain[:, 1])[::10]
+chain = talktools.chains.load_chain('main_text_KaKi', stride=10)
+ka_chain, ki_chain = chain['ka'], chain['ki']
 
 
 # Identifier as to plot all of the data or not. 
 ALL_DATA = 0
 FIT_STRAIN = ['O2', 260]
 
-# Compute the summary data
-summary = data.groupby(['operator', 'repressors', 
-            'IPTGuM']).agg(('mean','sem')).reset_index()
+# Load the summary data
+summary = talktools.data.load_dataset('wt_summary')
 
 # ##############################################################################
 # FIGURE INSTANTIATION
@@ -106,13 +104,13 @@ for g, d in summary.groupby(['operator', 'repressors']):
     # Plot the data. 
     if ALL_DATA == 0: 
         if plot == 1:
-            _ax.errorbar(d['IPTGuM'], d['fold_change_A']['mean'], 
-                    d['fold_change_A']['sem'], lw=1, capsize=1,
+            _ax.errorbar(d['IPTGuM'], d['mean'], 
+                    d['sem'], lw=1, capsize=1,
             fmt='.', ms=6, markeredgewidth=0.5, markerfacecolor=face, 
             color=rep_colors[g[1]], label='__legend__')
     else:
-         _ax.errorbar(d['IPTGuM'], d['fold_change_A']['mean'], 
-                     d['fold_change_A']['sem'], lw=1, capsize=1,
+         _ax.errorbar(d['IPTGuM'], d['mean'], 
+                     d['sem'], lw=1, capsize=1,
             fmt='.', ms=6, markeredgewidth=0.5, markerfacecolor=face, 
             color=rep_colors[g[1]], label='__nolegend__')
 
@@ -131,10 +129,8 @@ else:
 # ##############################################################################
 ALL_DATA = 0
 # Load the MCMC chains to draw credible regions. 
-with open('../data/main_text_KaKi.pkl', 'rb') as pkl:
-    chain = pickle.load(pkl)
-ka_chain = np.exp(-chain[:, 0])[::10]
-ki_chain = np.exp(-chain[:, 1])[::10]
+chain = talktools.chains.load_chain('main_text_KaKi', stride=10)
+ka_chain, ki_chain = chain['ka'], chain['ki']
 
 # ##############################################################################
 # FIGURE INSTANTIATION
@@ -203,8 +199,8 @@ axes = {'leakiness':ax[0], 'saturation':ax[1], 'dynamic_range':ax[2],
 # # ##############################################################################
 # if ALL_DATA == 1:
 #     for g, d in data.groupby(['repressors', 'operator']):
-#         leakiness = d[d['IPTGuM']==0]['fold_change_A'].values
-#         sat =d[d['IPTGuM']==d['IPTGuM'].max()]['fold_change_A'].values
+#         leakiness = d[d['IPTGuM']==0]['fold_change'].values
+#         sat =d[d['IPTGuM']==d['IPTGuM'].max()]['fold_change'].values
 #         try:
 #             dyn_rng = sat - leakiness  
 #         except:
@@ -221,7 +217,7 @@ axes = {'leakiness':ax[0], 'saturation':ax[1], 'dynamic_range':ax[2],
 #                           label='__nolegend__', linestyle='none', ms=5, fmt='.') 
 
 #         # Inferred points
-#         with open(f'../data/SI_I_{g[-1]}_R{int(g[0])}.pkl', 'rb') as pkl:
+#         with open(f'{talktools.data.DATA_DIR}/SI_I_{g[-1]}_R{int(g[0])}.pkl', 'rb') as pkl:
 #             chain = pickle.load(pkl)
 #         ka_chain = np.exp(-chain[:,0])
 #         ki_chain = np.exp(-chain[:,1])
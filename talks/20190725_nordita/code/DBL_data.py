@@ -1,25 +1,29 @@
 # -*- coding: utf-8 -*-
 #%%
+import sys
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import phd.viz
 import phd.thermo
 import phd.stats
-constants = phd.thermo.load_constants()
+sys.path.insert(0, '../../../')
+import talktools.constants
+import talktools.data
+constants = talktools.constants.load_constants()
 colors = phd.viz.phd_style()
 
 # Load and prune data and deltaF
-data = pd.read_csv('../data/summarized_data.csv')
+data = talktools.data.load_dataset('summarized')
 data = data[data['class']=='DBL'].copy()
-deltaF = pd.read_csv('../data/empirical_F_statistics.csv')
+deltaF = talktools.data.load_dataset('empirical_F_statistics')
 deltaF = deltaF[deltaF['class']=='DBL'].copy()
 
 # Load the sampling information
-epRA_samples = pd.read_csv('../data/DNA_binding_energy_samples.csv')
+epRA_samples = talktools.data.load_dataset('DNA_binding_energy_samples')
 epRA_samps = epRA_samples[(epRA_samples['operator']=='O2') & 
                            (epRA_samples['repressors']==260)].copy()
-kaki_epai_samples = pd.read_csv('../data/KaKi_epAI_samples.csv')
+kaki_epai_samples = talktools.data.load_dataset('KaKi_epAI_samples')
 kaki_epai_samps = kaki_epai_samples[kaki_epai_samples['operator']=='O2'].copy()
 
 IND_DATA = 0
@@ -1,15 +1,21 @@
 # -*- coding: utf-8 -*-
+import sys
+import functools
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import phd.viz 
-import phd.stats
 import phd.thermo
+sys.path.insert(0, '../../../')
+import talktools.grids
+import talktools.thermo
+import talktools.stats
+import talktools.data
 colors = phd.viz.phd_style()
 
 # Load some of the sampling information
-epRA_samples = pd.read_csv('../data/DNA_binding_energy_samples.csv')
-allo_samples = pd.read_csv('../data/KaKi_epAI_samples.csv')
+epRA_samples = talktools.data.load_dataset('DNA_binding_energy_samples')
+allo_samples = talktools.data.load_dataset('KaKi_epAI_samples')
 
 # Restrict to a single mutant
 epRA_samples = epRA_samples[(epRA_samples['mutant']=='Q21A') & 
@@ -34,9 +40,10 @@ epAI_sel = epAI_draws[:10]
 
 # Define the range of concentrations
 c_range = np.logspace(-2, 4, 200)
-c, ka, ki ,ep, ep_AI = np.meshgrid(c_range, ka_sel, ki_sel, ep_sel, epAI_sel)
-arch = phd.thermo.SimpleRepression(R=260, ep_r=ep, ka=ka, ki=ki, ep_ai=ep_AI,
-                                   effector_conc=c).fold_change()
+arch = talktools.grids.evaluate_grid(talktools.thermo.fold_change,
+                                     {'effector_conc':c_range, 'ka':ka_sel, 
+                                      'ki':ki_sel, 'ep_r':ep_sel, 
+                                      'ep_ai':epAI_sel}, R=260)
 # ##############################################################################
 # FIGURE INSTANTIATION -- DRAWS 
 # ############################################################################## 
@@ -109,12 +116,13 @@ if SEL_DRAWS == 1:
 
     # Define the range of concentrations
     c_range = np.logspace(-2, 4, 200)
-    c, ka, ki ,ep, ep_AI = np.meshgrid(c_range, ka_sel, ki_sel, ep_sel, epAI_sel)
-    arch = phd.thermo.SimpleRepression(R=260, ep_r=ep, ka=ka, ki=ki, ep_ai=ep_AI,
-                                   effector_conc=c).fold_change()
+    arch = talktools.grids.evaluate_grid(talktools.thermo.fold_change,
+                                         {'effector_conc':c_range, 'ka':ka_sel, 
+                                          'ki':ki_sel, 'ep_r':ep_sel, 
+                                          'ep_ai':epAI_sel}, R=260)
     for i in range(len(ep_sel)):
-        ax.plot(c_range, arch[i, :, i, i, i], '-', lw=0.1, 
-                color=colors['dark_purple'])
+        ax.plot(c_range, arch.isel(ka=i, ki=i, ep_r=i, ep_ai=i).values, '-',
+                lw=0.1, color=colors['dark_purple'])
 
 if ALL_DRAWS == 1:
     # Define the range of concentrations
@@ -128,13 +136,12 @@ if ALL_DRAWS == 1:
 
 
 if HPD==1:
-    cred_region = np.zeros((2, len(c_range)))
-    for i, c in enumerate(c_range):
-        arch = phd.thermo.SimpleRepression(R=260, ep_r=ep_draws, 
-                ka=ka_draws.values, ki=ki_draws.values, 
-                ep_ai=epAI_draws.values,
-                effector_conc=c).fold_change()
-        cred_region[:, i] = phd.stats.compute_hpd(arch, 0.95)
+    # Evaluate every draw at every concentration in one pass.
+    model = functools.partial(talktools.thermo.fold_change, R=260)
+    cred_region = talktools.stats.credible_band(model, 
+                        {'ep_r':ep_draws, 'ka':ka_draws.values, 
+                         'ki':ki_draws.values, 'ep_ai':epAI_draws.values},
+                        c_range, 0.95)
     ax.fill_between(c_range, cred_region[0, :], cred_region[1, :],  color=colors['purple'],
                     alpha=0.5)
 plt.tight_layout()
@@ -1,24 +1,21 @@
 # -*- coding: utf-8 -*-
 #%%
+import sys
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import phd.viz
 import phd.thermo
 import imp
+sys.path.insert(0, '../../../')
+import talktools.constants
+import talktools.data
 imp.reload(phd.viz)
 colors = phd.viz.phd_style()
-constants = phd.thermo.load_constants()
+constants = talktools.constants.load_constants()
 
-# Load data and correct names
-data = pd.read_csv('../data/RazoMejia2018_data.csv')
-data = data[data['repressors']> 0].copy()
-data['repressors'] *= 2
-data.rename(columns={'IPTG_uM':'IPTGuM'}, inplace=True)
-
-# Compute the summary statistics
-summary = data.groupby(['operator', 'repressors', 
-            'IPTGuM']).agg(('mean','sem')).reset_index()
+# Load the summary statistics of the wild-type data
+summary = talktools.data.load_dataset('wt_summary')
 
 # ##############################################################################
 # FIGURE INSTANTIATION
@@ -68,11 +65,11 @@ if DATA == 1:
 
         if FIT_ONLY == 1:
             if plot == 1:
-                ax.errorbar(bohr, d['fold_change_A']['mean'], d['fold_change_A']['sem'],
+                ax.errorbar(bohr, d['mean'], d['sem'],
                 fmt=op_glyphs[g[1]], lw=0.75, capsize=1, color=rep_colors[g[0]],
                 markerfacecolor=face, markeredgewidth=0.5)
         else:
-            ax.errorbar(bohr, d['fold_change_A']['mean'], d['fold_change_A']['sem'],
+            ax.errorbar(bohr, d['mean'], d['sem'],
                 fmt=op_glyphs[g[1]], lw=0.75, capsize=1, color=rep_colors[g[0]],
                 markerfacecolor=face, markeredgewidth=0.5)
 
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 #%%
+import sys
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -7,23 +8,21 @@ import phd.viz
 import phd.thermo
 import phd.stats
 import seaborn as sns
-import pickle
 import imp
+sys.path.insert(0, '../../../')
+import talktools.constants
+import talktools.data
+import talktools.chains
 imp.reload(phd.viz)
 colors = phd.viz.phd_style()
-constants = phd.thermo.load_constants()
+constants = talktools.constants.load_constants()
 
-# Load data and correct names
-data = pd.read_csv('../data/RazoMejia2018_data.csv')
-data = data[data['repressors']> 0].copy()
-data['repressors'] *= 2
-data.rename(columns={'IPTG_uM':'IPTGuM'}, inplace=True)
+# Load the tidied wild-type data
+data = talktools.data.load_dataset('wt_tidy')
 
 # Load the MCMC chains to draw credible regions. 
-with open('../data/main_text_KaKi.pkl', 'rb') as pkl:
-    chain = pickle.load(pkl)
-ka_chain = np.exp(-chain[:, 0])[::10]
-ki_chain = np.exp(-chain[:, 1])[::10]
+chain = talktools.chains.load_chain('main_text_KaKi', stride=10)
+ka_chain, ki_chain = chain['ka'], chain['ki']
 
 
 # Identifier as to plot all of the data or not. 
@@ -33,9 +32,8 @@ IND_ONLY = 0
 COLLAPSE = 1
 
 
-# Compute the summary data
-summary = data.groupby(['operator', 'repressors', 
-            'IPTGuM']).agg(('mean','sem')).reset_index()
+# Load the summary data
+summary = talktools.data.load_dataset('wt_summary')
 
 # ##############################################################################
 # FIGURE INSTANTIATION
@@ -121,13 +119,13 @@ for g, d in summary.groupby(['operator', 'repressors']):
     # Plot the data. 
     if ALL_DATA == 0: 
         if plot == 1:
-            _ax.errorbar(d['IPTGuM'], d['fold_change_A']['mean'], 
-                    d['fold_change_A']['sem'], lw=1, capsize=1,
+            _ax.errorbar(d['IPTGuM'], d['mean'], 
+                    d['sem'], lw=1, capsize=1,
             fmt='.', ms=6, markeredgewidth=0.5, markerfacecolor=face, 
             color=rep_colors[g[1]], label='__legend__')
     else:
-         _ax.errorbar(d['IPTGuM'], d['fold_change_A']['mean'], 
-                     d['fold_change_A']['sem'], lw=1, capsize=1,
+         _ax.errorbar(d['IPTGuM'], d['mean'], 
+                     d['sem'], lw=1, capsize=1,
             fmt='.', ms=6, markeredgewidth=0.5, markerfacecolor=face, 
             color=rep_colors[g[1]], label='__nolegend__')
 
@@ -149,7 +147,7 @@ if IND_ONLY == 0:
         else:
             face = face_colors[g[1]]
             label = '__nolegend__'
-        ax[1, 1].errorbar(bohr, d['fold_change_A']['mean'], d['fold_change_A']['sem'],
+        ax[1, 1].errorbar(bohr, d['mean'], d['sem'],
                          fmt=glyphs[g[0]], color=rep_colors[g[1]], lw=0.5, 
                          capsize=1, ms=2, markeredgewidth=0.5, 
                          markerfacecolor=face, label='__nolegend__')
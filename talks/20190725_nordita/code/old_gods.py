@@ -1,14 +1,17 @@
 # -*- coding: utf-8 -*-
+import sys
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import phd.viz
 import phd.thermo
-constants = phd.thermo.load_constants()
-constants['Oid'] = -17.3
+sys.path.insert(0, '../../../')
+import talktools.constants
+import talktools.data
+constants = talktools.constants.load_constants(Oid=-17.3)
 colors = phd.viz.phd_style()
 
-data = pd.read_csv('../data/Garcia2011_Brewster2014_data.csv')
+data = talktools.data.load_dataset('Garcia2011_Brewster2014')
 
 FIT_STRAIN = 1
 ALL_DATA = 0
@@ -1,19 +1,23 @@
 # -*- coding: utf-8 -*-
 #%%
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
 import phd.thermo
 import phd.viz
+sys.path.insert(0, '../../../')
+import talktools.constants
+import talktools.data
 colors, color_list = phd.viz.phd_style()
-constants = phd.thermo.load_constants()
+constants = talktools.constants.load_constants()
 
 # Load in the data sets
-data = pd.read_csv('../data/summarized_data.csv')
+data = talktools.data.load_dataset('summarized')
 data = data[data['class']=='DNA']
-stats = pd.read_csv('../data/DNA_binding_energy_summary.csv')
+stats = talktools.data.load_dataset('DNA_binding_energy_summary')
 stats = stats[stats['repressors']==260]
-bohr = pd.read_csv('../data/empirical_F_statistics.csv')
+bohr = talktools.data.load_dataset('empirical_F_statistics')
 empirical_bohr = bohr[bohr['class']=='DNA']
 
 # Define some plotting constants. 
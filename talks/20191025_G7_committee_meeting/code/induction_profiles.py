@@ -1,13 +1,20 @@
 #%%
+import sys
+import functools
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import phd.stats
 import phd.viz
 import phd.thermo
-import pickle
+sys.path.insert(0, '../../../')
+import talktools.cache
+import talktools.thermo
+import talktools.constants
+import talktools.data
+import talktools.chains
 colors, color_list = phd.viz.phd_style()
-constants = phd.thermo.load_constants()
+constants = talktools.constants.load_constants()
 title_bbox = dict(facecolor='none', edgecolor=colors['light_grey'], lw=0.1)
 #%%
 # Define the figure generation variables. 
@@ -24,23 +31,12 @@ fill_reps = {22:colors['light_purple'],  60:colors['light_orange'],
             1220: colors['light_blue'], 1740: colors['light_green']}
 # %%
 # Load the summarzed fold-change data
-data = pd.read_csv('../data/RazoMejia2018_data.csv', comment='#')
-
-# Summarize the data for display.
-data = data[data['repressors'] > 0]
-data['repressors'] *= 2
-data.rename(columns={'fold_change_A':'fold_change', 'IPTG_uM': 'IPTGuM'},
-            inplace=True)
-
-summarized = data.groupby(['operator', 'repressors', 
-                           'IPTGuM']).agg(('mean', 'sem')).reset_index()
+summarized = talktools.data.load_dataset('wt_summary')
 
 
 # Load the MCMC samples from the induction paper for O2 R260
-with open('../data/SI_I_O2_R260.pkl', 'rb') as f:
-    out = pickle.load(f)
-    fit_ka = np.exp(-out[:, 0][::10])
-    fit_ki = np.exp(-out[:, 1][::10])
+chain = talktools.chains.load_chain('SI_I_O2_R260', stride=10)
+fit_ka, fit_ki = chain['ka'], chain['ki']
 # %%
 # Instantiate the figure canvas. 
 fig, ax = plt.subplots(1, 3, figsize=(8, 3), sharey=True, sharex=True)
@@ -62,14 +58,13 @@ ax[2].set_title('operator O3 (low affinity)', fontsize=8, color=colors['light_gr
 
 # Plot the theoretical predictions
 if ALL_PRED:
-    for g, d in data.groupby(['repressors', 'operator']):
-        cred_region = np.zeros((2, len(C_RANGE)))
-        for i, c in enumerate(C_RANGE):
-            fc = phd.thermo.SimpleRepression(R=g[0], ep_r=constants[g[1]], 
-                                             ka=fit_ka, ki=fit_ki, 
-                                             ep_ai=constants['ep_AI'],
-                                             effector_conc=c).fold_change()
-            cred_region[:, i] = phd.stats.compute_hpd(fc, 0.95) 
+    for g, d in summarized.groupby(['repressors', 'operator']):
+        model = functools.partial(talktools.thermo.fold_change, R=g[0],
+                                  ep_r=constants[g[1]],
+                                  ep_ai=constants['ep_AI'])
+        cred_region = talktools.cache.cached_credible_band(model, 
+                                        {'ka':fit_ka, 'ki':fit_ki}, C_RANGE,
+                                        0.95)
         _axes[g[1]].fill_between(C_RANGE, cred_region[0, :], cred_region[1, :],
                                 color=fill_reps[g[0]], alpha=0.75, label=g[0])
 
@@ -84,14 +79,14 @@ for g, d in summarized.groupby(['repressors', 'operator']):
             pass
         else:
             _ax = _axes[g[1]]
-            _ax.errorbar(d['IPTGuM'], d['fold_change']['mean'], 
-                    d['fold_change']['sem'], capsize=1, lw=0.75, color=edge_reps[g[0]],
+            _ax.errorbar(d['IPTGuM'], d['mean'], 
+                    d['sem'], capsize=1, lw=0.75, color=edge_reps[g[0]],
                     fmt='.', ms=6, markerfacecolor=fill_reps[g[0]], markeredgewidth=0.75,
                     label='__nolegend__')
     else:
        _ax = _axes[g[1]]
-       _ax.errorbar(d['IPTGuM'], d['fold_change']['mean'], 
-            d['fold_change']['sem'], capsize=1, lw=0.75, color=edge_reps[g[0]],
+       _ax.errorbar(d['IPTGuM'], d['mean'], 
+            d['sem'], capsize=1, lw=0.75, color=edge_reps[g[0]],
             fmt='.', ms=6, markerfacecolor=fill_reps[g[0]], markeredgewidth=0.75,
             label='__nolegend__')
 
@@ -1,11 +1,15 @@
 #%%
+import sys
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import phd.viz
 import phd.thermo
+sys.path.insert(0, '../../../')
+import talktools.constants
+import talktools.data
 colors, palette = phd.viz.phd_style()
-constants = phd.thermo.load_constants()
+constants = talktools.constants.load_constants()
 # %%
 # Define what should be plotted
 data = True
@@ -20,11 +24,11 @@ rep_fill_colors = {r:colors[f'pale_{c}'] for r, c in zip(reps, base_colors)}
 
 # %%
 # Load the fold-change, empirical F, and inference data
-fc_data = pd.read_csv('../data/summarized_data.csv', comment='#')
+fc_data = talktools.data.load_dataset('summarized', comment='#')
 fc_data = fc_data[fc_data['class']=='DNA']
-F_data = pd.read_csv('../data/empirical_F_statistics.csv', comment='#')
+F_data = talktools.data.load_dataset('empirical_F_statistics', comment='#')
 F_data = F_data[F_data['class']=='DNA']
-epRA = pd.read_csv('../data/DNA_binding_energy_summary.csv', comment='#')
+epRA = talktools.data.load_dataset('DNA_binding_energy_summary', comment='#')
 epRA = epRA[epRA['repressors']==260]
 # %%
 fig, ax = plt.subplots(2, 3, figsize=(7, 5), dpi=100)
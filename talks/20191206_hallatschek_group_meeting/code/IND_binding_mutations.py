@@ -1,12 +1,16 @@
 #%%
+import sys
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import phd.viz
 import phd.thermo
 import phd.stats
+sys.path.insert(0, '../../../')
+import talktools.constants
+import talktools.data
 colors, palette = phd.viz.phd_style()
-constants = phd.thermo.load_constants()
+constants = talktools.constants.load_constants()
 data = True
 free_energy = True
 fit = True
@@ -14,11 +18,11 @@ fit = True
 
 # %%
 # Load the data sources. 
-fc_data = pd.read_csv('../data/summarized_data.csv', comment='#')
+fc_data = talktools.data.load_dataset('summarized', comment='#')
 fc_data = fc_data[fc_data['class']=='IND']
-emp_F = pd.read_csv('../data/empirical_F_statistics.csv', comment='#')
+emp_F = talktools.data.load_dataset('empirical_F_statistics', comment='#')
 emp_F = emp_F[emp_F['class']=='IND']
-KaKi_epAI = pd.read_csv('../data/KaKi_epAI_samples.csv', comment='#')
+KaKi_epAI = talktools.data.load_dataset('KaKi_epAI_samples', comment='#')
 KaKi_epAI = KaKi_epAI[KaKi_epAI['operator']=='O2']
 
 # %%
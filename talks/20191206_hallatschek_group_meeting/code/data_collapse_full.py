@@ -1,31 +1,29 @@
 # -*- coding: utf-8 -*-
 #%%
+import sys
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import phd.viz
 import phd.thermo
+sys.path.insert(0, '../../../')
+import talktools.constants
+import talktools.data
 colors, color_list = phd.viz.phd_style()
-constants = phd.thermo.load_constants()
-constants['Oid'] = -17
+constants = talktools.constants.load_constants()
 mut_colors = phd.viz.color_selector('mut')
 
 # Load the data from the mutants work.
-data = pd.read_csv('../data/summarized_data.csv')
+data = talktools.data.load_dataset('summarized')
 data = data[data['mutant']!='wt']
-epRA_stats = pd.read_csv('../data/DNA_binding_energy_summary.csv')
+epRA_stats = talktools.data.load_dataset('DNA_binding_energy_summary')
 epRA_stats = epRA_stats[epRA_stats['repressors']==260]
-allo_stats = pd.read_csv('../data/KaKi_epAI_summary.csv')
+allo_stats = talktools.data.load_dataset('KaKi_epAI_summary')
 allo_stats = allo_stats[allo_stats['operator']=='O2']
 
 # Load the data from the old gods
-old_gods = pd.read_csv('../data/Garcia2011_Brewster2014_data.csv')
-new_gods = pd.read_csv('../data/RazoMejia2018_data.csv')
-new_gods['repressors'] *= 2
-new_gods = new_gods[new_gods['repressors'] > 0]
-new_gods.rename(columns={'IPTG_uM':'IPTGuM', 'fold_change_A':'fold_change'},
-    inplace=True)
-new_gods = new_gods.groupby(['repressors', 'operator', 'IPTGuM']).agg(('mean', 'sem')).reset_index()
+old_gods = talktools.data.load_dataset('Garcia2011_Brewster2014')
+new_gods = talktools.data.load_dataset('wt_summary')
 
 # Define plotting constant
 OLD_GODS = 0 
@@ -85,8 +83,8 @@ if NEW_GODS == 1:
                                        ka=constants['Ka'], ki=constants['Ki'],
                                        ep_ai=constants['ep_AI'], 
             effector_conc=d['IPTGuM']).bohr_parameter() 
-        ax.errorbar(bohr, d['fold_change']['mean'], 
-                    d['fold_change']['sem'], fmt=op_glyphs[g[1]],  color=edge_reps[g[0]],
+        ax.errorbar(bohr, d['mean'], 
+                    d['sem'], fmt=op_glyphs[g[1]],  color=edge_reps[g[0]],
                      markeredgewidth=1, markerfacecolor=fill_reps[g[0]], 
                      linestyle='none', lw=0.75, capsize=1, ms=8, alpha=0.75,
                      label='__nolegend__')
@@ -1,9 +1,13 @@
 #%%
+import sys
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import phd.viz
 import phd.thermo
+sys.path.insert(0, '../../../')
+import talktools.grids
+import talktools.thermo
 colors, palette = phd.viz.phd_style()
 
 # Define the number of repressors 
@@ -15,11 +19,10 @@ c_range = np.logspace(-2, 4, 400)
 # Define the DNA binding energies. 
 ep_range = np.array([-16, -14, -12, -10])
 
-# Mesh and compute the fold-change. 
-c, ep = np.meshgrid(c_range, ep_range)
-arch = phd.thermo.SimpleRepression(R=r, ep_r=ep, ep_ai=4.5, effector_conc=c,
-                                ka=200, ki=1)
-fc = arch.fold_change()
+# Compute the fold-change over each energy and concentration. 
+fc = talktools.grids.evaluate_grid(talktools.thermo.fold_change,
+                                   {'ep_r':ep_range, 'effector_conc':c_range},
+                                   R=r, ep_ai=4.5, ka=200, ki=1)
 
 
 # %%
@@ -37,7 +40,7 @@ ep_colors = [colors['dark_red'], colors['dark_orange'], colors['orange'],
             colors['light_orange']]
 
 for i in range(4):
-    ax.plot(c_range, fc[i, :], lw=2, color=ep_colors[i], label=int(ep_range[i]))
+    ax.plot(c_range, fc.isel(ep_r=i).values, lw=2, color=ep_colors[i], label=int(ep_range[i]))
 
 ax.legend(title=r'$\Delta\varepsilon_{RA}$ [$k_BT$]', fontsize=9)
 plt.savefig('../figs/inducer_titration_theory.pdf', bbox_inches='tight',
@@ -1,32 +1,23 @@
 #%% 
+import sys
 import numpy as np
-import pandas as pd
 import matplotlib.pyplot as plt
 import phd.viz
-import phd.thermo
-import phd.stats
-import pickle
+sys.path.insert(0, '../../../')
+import talktools.constants
+import talktools.data
+import talktools.chains
+import talktools.predictions
 colors, palette = phd.viz.phd_style()
 show_data = False
-constants = phd.thermo.load_constants()
+constants = talktools.constants.load_constants()
 
-#%% Load the titration data and prune
-data = pd.read_csv('../data/RazoMejia2018_data.csv', comment='#')
-data = data[(data['repressors'] > 0)]
-data['repressors'] *= 2
-data.rename(columns={'fold_change_A':'fold_change'}, inplace=True)
-
-# Comput the summary of the data. 
-data = data.groupby(['repressors', 'operator', 'IPTG_uM']).agg(
-                    ('mean', 'sem')).reset_index()
+#%% Load the summary of the titration data
+data = talktools.data.load_dataset('wt_summary')
 
 # %%
 # Load the MCMC samples
-with open('../data/SI_I_O2_R260.pkl', 'rb') as file:
-    chains = pickle.load(file)
-    chain_df = pd.DataFrame(chains, columns=['ep_a', 'ep_i', 'sigma'])
-    chain_df['Ka'] = np.exp(-chain_df['ep_a'])
-    chain_df['Ki'] = np.exp(-chain_df['ep_i'])
+chain = talktools.chains.load_chain('SI_I_O2_R260', stride=10)
 
 # Define the inducer concentration range
 c_range = np.logspace(-2, 4, 200)
@@ -52,16 +43,16 @@ for i, o in enumerate(['O1', 'O2', 'O3']):
                      color=colors['black'], bgcolor=colors['grey'], size=10,
                      pad=0.07)
 
+# Compute the cred regions of every strain from one evaluation of p_act
+ops = ['O1', 'O2', 'O3']
+bands = talktools.predictions.repression_bands(c_range, 
+                    {'ka':chain['ka'], 'ki':chain['ki']}, reps, 
+                    [constants[o] for o in ops], 0.95, ep_ai=4.5)
+
 # Plot the cred regions
-for i , o in enumerate(['O1', 'O2', 'O3']):
-    for j, r in enumerate([22, 60, 124, 260, 1220, 1740]):
-        cred_region = np.zeros((2, len(c_range)))
-        for k, c in enumerate(c_range):
-            fc = phd.thermo.SimpleRepression(R=r, ep_r=constants[o], 
-                    effector_conc=c, ka=chain_df['Ka'].values[::10],
-                    ki=chain_df['Ki'].values[::10], ep_ai=4.5).fold_change()
-            cred_region[:, k] = phd.stats.compute_hpd(fc, 0.95)
-        ax[i].fill_between(c_range, cred_region[0, :], cred_region[1, :],
+for i , o in enumerate(ops):
+    for j, r in enumerate(reps):
+        ax[i].fill_between(c_range, bands[j, i, 0], bands[j, i, 1],
                 color=colors[band_colors[j]], alpha=0.5)
 
 # Plot the data. 
@@ -70,16 +61,16 @@ for g, d in data.groupby(['operator', 'repressors']):
     _ax = op_ax[g[0]]
     if (g[0] == 'O2') & (g[1]==260):
         face='w'
-        _ax.errorbar(d['IPTG_uM'], d['fold_change']['mean'], 
-            yerr=d['fold_change']['sem'], fmt='.', ms=10, 
+        _ax.errorbar(d['IPTGuM'], d['mean'], 
+            yerr=d['sem'], fmt='.', ms=10, 
             markerfacecolor=face,
             markeredgecolor=rep_edge_colors[g[1]],
             color=rep_edge_colors[g[1]], label=int(g[1]))
     else:
         face = rep_fill_colors[g[1]]
         if show_data == True:
-            _ax.errorbar(d['IPTG_uM'], d['fold_change']['mean'], 
-                yerr=d['fold_change']['sem'], fmt='.', ms=10, 
+            _ax.errorbar(d['IPTGuM'], d['mean'], 
+                yerr=d['sem'], fmt='.', ms=10, 
                 markerfacecolor=face,
                 markeredgecolor=rep_edge_colors[g[1]],
                 color=rep_edge_colors[g[1]], label=int(g[1]))
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 #%%
+import sys
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -7,32 +8,32 @@ import phd.viz
 import phd.thermo
 import phd.stats
 import seaborn as sns
-import pickle
 import imp
+sys.path.insert(0, '../../../')
+import talktools.kernels
+import talktools.stats
+import talktools.thermo
+import talktools.constants
+import talktools.data
+import talktools.chains
 imp.reload(phd.viz)
 colors, palette = phd.viz.phd_style()
-constants = phd.thermo.load_constants()
+constants = talktools.constants.load_constants()
 
-# Load data and correct names
-data = pd.read_csv('../data/RazoMejia2018_data.csv')
-data = data[data['repressors']> 0].copy()
-data['repressors'] *= 2
-data.rename(columns={'IPTG_uM':'IPTGuM'}, inplace=True)
+# Load the tidied wild-type data
+data = talktools.data.load_dataset('wt_tidy')
 
 # Load the MCMC chains to draw credible regions. 
-with open('../data/main_text_KaKi.pkl', 'rb') as pkl:
-    chain = pickle.load(pkl)
-ka_chain = np.exp(-chain[:, 0])[::10]
-ki_chain = np.exp(-chain[:, 1])[::10]
+chain = talktools.chains.load_chain('main_text_KaKi', stride=10)
+ka_chain, ki_chain = chain['ka'], chain['ki']
 
 
 # Identifier as to plot all of the data or not. 
 ALL_DATA = 0
 FIT_STRAIN = ['O2', 260]
 
-# Compute the summary data
-summary = data.groupby(['operator', 'repressors', 
-            'IPTGuM']).agg(('mean','sem')).reset_index()
+# Load the summary data
+summary = talktools.data.load_dataset('wt_summary')
 
 # ##############################################################################
 # FIGURE INSTANTIATION
@@ -107,13 +108,13 @@ for t, a in axes.items():
 #     # Plot the data. 
 #     if ALL_DATA == 0: 
 #         if plot == 1:
-#             _ax.errorbar(d['IPTGuM'], d['fold_change_A']['mean'], 
-#                     d['fold_change_A']['sem'], lw=1, capsize=1,
+#             _ax.errorbar(d['IPTGuM'], d['mean'], 
+#                     d['sem'], lw=1, capsize=1,
 #             fmt='.', ms=6, markeredgewidth=0.5, markerfacecolor=face, 
 #             color=rep_colors[g[1]], label='__legend__')
 #     else:
-#          _ax.errorbar(d['IPTGuM'], d['fold_change_A']['mean'], 
-#                      d['fold_change_A']['sem'], lw=1, capsize=1,
+#          _ax.errorbar(d['IPTGuM'], d['mean'], 
+#                      d['sem'], lw=1, capsize=1,
 #             fmt='.', ms=6, markeredgewidth=0.5, markerfacecolor=face, 
 #             color=rep_colors[g[1]], label='__nolegend__')
 
@@ -132,10 +133,8 @@ for t, a in axes.items():
 # ##############################################################################
 ALL_DATA = 1
 # Load the MCMC chains to draw credible regions. 
-with open('../data/main_text_KaKi.pkl', 'rb') as pkl:
-    chain = pickle.load(pkl)
-ka_chain = np.exp(-chain[:, 0])[::10]
-ki_chain = np.exp(-chain[:, 1])[::10]
+chain = talktools.chains.load_chain('main_text_KaKi', stride=10)
+ka_chain, ki_chain = chain['ka'], chain['ki']
 
 # ##############################################################################
 # FIGURE INSTANTIATION
@@ -188,19 +187,12 @@ for i, o in enumerate(['O1', 'O2', 'O3']):
     for k, v in arch.items():
         axes[k].plot(rep_range, v, color=op_colors[o], label=o)
 
-    # Credible regions
-    _ = np.zeros((2, len(rep_range)))
-    cred_regions = {'saturation': _.copy(),
-                    'dynamic_range':_.copy(), 'EC50':_.copy(),
-                    'effective_hill':_.copy()}
-    for j, r in enumerate(rep_range):
-        arch = phd.thermo.SimpleRepression(R=r,ep_r=constants[o], 
-                                           ka=ka_chain, ki=ki_chain,
-                                           ep_ai=constants['ep_AI'],
-                                           effector_conc=0).compute_properties()
-        for k, v in arch.items():
-            if k != 'leakiness':
-                cred_regions[k][:, j] = phd.stats.compute_hpd(v, 0.95)
+    # Credible regions over the whole (repressors x samples) block
+    props = talktools.kernels.induction_properties(rep_range, constants[o],
+                                                   ka_chain, ki_chain,
+                                                   constants['ep_AI'])
+    cred_regions = {k:talktools.stats.compute_hpd(v, 0.95, axis=1)
+                    for k, v in props.items() if k != 'leakiness'}
     for k, v in cred_regions.items():
         axes[k].fill_between(rep_range, v[0, :], v[1, :], color=op_colors[o],
                             alpha=0.3, label='__nolegend__')
@@ -210,8 +202,8 @@ for i, o in enumerate(['O1', 'O2', 'O3']):
 # # ##############################################################################
 if ALL_DATA == 1:
     for g, d in data.groupby(['repressors', 'operator']):
-        leakiness = d[d['IPTGuM']==0]['fold_change_A'].values
-        sat =d[d['IPTGuM']==d['IPTGuM'].max()]['fold_change_A'].values
+        leakiness = d[d['IPTGuM']==0]['fold_change'].values
+        sat =d[d['IPTGuM']==d['IPTGuM'].max()]['fold_change'].values
         try:
             dyn_rng = sat - leakiness  
         except:
@@ -229,10 +221,8 @@ if ALL_DATA == 1:
                           markerfacecolor=op_fill_colors[g[1]]) 
 
         # Inferred points
-        with open(f'../data/SI_I_{g[-1]}_R{int(g[0])}.pkl', 'rb') as pkl:
-            chain = pickle.load(pkl)
-        ka_chain = np.exp(-chain[:,0])
-        ki_chain = np.exp(-chain[:,1])
+        chain = talktools.chains.load_chain(f'SI_I_{g[-1]}_R{int(g[0])}')
+        ka_chain, ki_chain = chain['ka'], chain['ki']
         ka_median = np.median(ka_chain)
         ki_median = np.median(ki_chain)
 
@@ -247,10 +237,9 @@ if ALL_DATA == 1:
                    ms=4, markerfacecolor=op_fill_colors[g[1]], markeredgewidth=1)
 
         # Compute the credible regions:
-        arch = phd.thermo.SimpleRepression(R=g[0], ep_r=constants[g[1]],
-                                           ka=ka_chain, ki=ki_chain, 
-                                           ep_ai=constants['ep_AI'],
-                                           effector_conc=0).compute_properties()
+        arch = talktools.thermo.compute_properties(g[0], constants[g[1]],
+                                                   ka_chain, ki_chain,
+                                                   constants['ep_AI'])
         ec50_cred = phd.stats.compute_hpd(arch['EC50'], 0.95)
         hill_cred = phd.stats.compute_hpd(arch['effective_hill'], 0.95)
     
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 #%%
+import sys
 import numpy as np
 from bokeh.themes import Theme
 import phd.viz
@@ -11,6 +12,8 @@ from bokeh.models import ColumnDataSource, Div, CustomJS, CDSView, IndexFilter
 from bokeh.layouts import layout, widgetbox
 from bokeh.models.widgets import Select, Slider, RadioButtonGroup, Button
 from bokeh.embed import components
+sys.path.insert(0, '../../../')
+import talktools.thermo
 phd.viz.bokeh_theme()
 colors, palette = phd.viz.phd_style()
 bokeh.plotting.output_file("../figs/model_explorer.html", mode="inline")
@@ -22,11 +25,10 @@ subsamp = list(np.arange(0, len(c_range), 25))
 bohr_range = np.linspace(-20, 20, 500)
 
 # Set the reference induction profile
-ref_arch = phd.thermo.SimpleRepression(R=260, ep_r=-13.9, effector_conc=c_range,
-                                    ka=139, ki=0.53, ep_ai=4.5, 
-                                    n_sites=2)
-ref_fc = ref_arch.fold_change()
-ref_bohr = ref_arch.bohr_parameter()
+ref_arch = talktools.thermo.evaluate(c_range, R=260, ep_r=-13.9, ka=139,
+                                     ki=0.53, ep_ai=4.5, n_sites=2)
+ref_fc = ref_arch['fold_change']
+ref_bohr = ref_arch['bohr_parameter']
 ref_delta_bohr = ref_bohr - ref_bohr
 # Define the source
 source = ColumnDataSource(data=dict(c=c_range, ref_fc=ref_fc, 
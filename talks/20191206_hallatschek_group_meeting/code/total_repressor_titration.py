@@ -1,9 +1,13 @@
 #%%
+import sys
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import phd.viz
 import phd.thermo
+sys.path.insert(0, '../../../')
+import talktools.grids
+import talktools.thermo
 colors, palette = phd.viz.phd_style()
 
 # %%
@@ -13,11 +17,10 @@ rep_range = np.logspace(0, 3, 200)
 # Define the DNA binding energies. 
 ep_range = np.array([-16, -14, -12, -10])
 
-# Mesh and compute the fold-change. 
-r, ep = np.meshgrid(rep_range, ep_range)
-arch = phd.thermo.SimpleRepression(R=r, ep_r=ep, ep_ai=100, effector_conc=0,
-                                ka=200, ki=0.5)
-fc = arch.fold_change()
+# Compute the fold-change over each energy and repressor copy number. 
+fc = talktools.grids.evaluate_grid(talktools.thermo.fold_change,
+                                   {'ep_r':ep_range, 'R':rep_range},
+                                   ep_ai=100, effector_conc=0, ka=200, ki=0.5)
 
 # %%
 # Set up the figure canvas.
@@ -35,7 +38,7 @@ ep_colors = [colors['dark_red'], colors['dark_orange'], colors['orange'],
             colors['light_orange']]
 
 for i in range(4):
-    ax.plot(rep_range, fc[i, :], lw=2, color=ep_colors[i], label=int(ep_range[i]))
+    ax.plot(rep_range, fc.isel(ep_r=i).values, lw=2, color=ep_colors[i], label=int(ep_range[i]))
 ax.legend(title=r'$\Delta\varepsilon_{RA}$ [$k_BT$]', fontsize=10)
 plt.savefig('../figs/total_repressor_titration.pdf', bbox_inches='tight', 
             facecolor=None)
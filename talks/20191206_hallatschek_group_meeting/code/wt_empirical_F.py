@@ -1,16 +1,20 @@
 # -*- coding: utf-8 -*-
 #%%
+import sys
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import phd.viz
 import phd.thermo
 import phd.stats
+sys.path.insert(0, '../../../')
+import talktools.constants
+import talktools.data
 colors, palette = phd.viz.phd_style()
-constants = phd.thermo.load_constants()
+constants = talktools.constants.load_constants()
 
 # Load all of the data. 
-data = pd.read_csv('../data/RazoMejia2018_2019_full_data.csv')
+data = talktools.data.load_dataset('RazoMejia2018_2019_full')
 data = data[data['method']=='flow cytometry']
 ops = [constants[o] for o in data['operator'].values]
 data['ref_bohr'] = phd.thermo.SimpleRepression(R=data['repressors'], ep_r=ops,
@@ -18,7 +22,7 @@ data['ref_bohr'] = phd.thermo.SimpleRepression(R=data['repressors'], ep_r=ops,
                                             ki=constants['Ki'],
                                             effector_conc=data['IPTGuM'],
                                             ep_ai=constants['ep_AI']).bohr_parameter()
-stats = pd.read_csv('../data/wt_empirical_F_statistics.csv')
+stats = talktools.data.load_dataset('wt_empirical_F_statistics')
 stats = stats[stats['method']=='flow cytometry']
 
 
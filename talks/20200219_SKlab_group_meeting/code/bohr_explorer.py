@@ -2,8 +2,11 @@
 import numpy as np
 import pandas as pd
 from bokeh.themes import Theme
+import sys
 import phd.viz
 import phd.thermo
+sys.path.insert(0, '../../../')
+import talktools.thermo
 import bokeh.io
 import bokeh.plotting
 from bokeh import events
@@ -29,10 +32,10 @@ c_range = np.logspace(-4, 6, 200)
 # Compute the starting position for point and curve. 
 fc = phd.thermo.SimpleRepression(R=rep_slider.value, ep_r=ep_slider.value,
            ka=200, ki=1, ep_ai=5, effector_conc=c_range).fold_change()
-fc_point = phd.thermo.SimpleRepression(R=rep_slider.value, ep_r=ep_slider.value,
-           ka=200, ki=1, ep_ai=5, effector_conc=10**c_slider.value).fold_change()
-bohr_point = phd.thermo.SimpleRepression(R=rep_slider.value, ep_r=ep_slider.value,
-           ka=200, ki=1, ep_ai=5, effector_conc=10**c_slider.value).bohr_parameter()
+point = talktools.thermo.evaluate(10**c_slider.value, R=rep_slider.value,
+           ep_r=ep_slider.value, ka=200, ki=1, ep_ai=5)
+fc_point = point['fold_change']
+bohr_point = point['bohr_parameter']
 
 # Set up the data source. 
 source = ColumnDataSource(pd.DataFrame({'fc':fc, 'c':c_range, 'c_ki':np.log10(c_range)}))
@@ -1,28 +1,19 @@
 #%%
+import sys
 import numpy as np
 import pandas as pd 
 import pickle
 import phd.viz 
 import phd.thermo
 import altair as alt
+sys.path.insert(0, '../../../')
+import talktools.data
 
 colors, palette = phd.viz.altair_theme()
-DATA_DIR = '../../../data'
 
-# Load the experimental data
-data = pd.read_csv(f'{DATA_DIR}/RazoMejia2018_data.csv', comment='#')
-
-# Make correction for tetramer to dimer
-data = data[(data['repressors'] > 0) & (data['operator'] != 'Oid')].copy()
-data['repressors'] *= 2
-
-# Rename so things make some sense. 
-data.rename(columns={'fold_change_A':'fold_change', 'IPTG_uM':'IPTGuM'},
-            inplace=True)
-
-# Compute the aggregate properties. 
-summary = data.groupby(['operator', 'repressors', 'binding_energy', 
-                        'IPTGuM'])['fold_change'].agg(('mean', 'sem')).reset_index()
+# Load the aggregate properties of the experimental data
+summary = talktools.data.load_dataset('wt_summary')
+summary = summary[summary['operator'] != 'Oid'].copy()
 summary.rename(columns={'mean':'fc_mean', 'sem':'fc_sem'}, inplace=True)
 
 summary['fc_min'] = summary['fc_mean'].values - summary['fc_sem'].values
@@ -2,8 +2,11 @@
 import numpy as np
 import pandas as pd
 from bokeh.themes import Theme
+import sys
 import phd.viz
 import phd.thermo
+sys.path.insert(0, '../../../')
+import talktools.thermo
 import bokeh.io
 import bokeh.plotting
 from bokeh import events
@@ -40,14 +43,16 @@ ref_c_slider = Slider(title='log\u2081\u2080 (c_ref / Ki)',
         start=-4, end=6, step=0.01, value=0, bar_color=colors['black'])
 
 # Define the architectures
-ref_arch_point = phd.thermo.SimpleRepression(R=ref_rep_slider.value, ep_r=ref_ep_slider.value,
-                                       ka=ka, ki=ki, ep_ai=ep_ai, 
-                                       effector_conc=10**(ref_c_slider.value * ki))
+ref_point = talktools.thermo.evaluate(10**(ref_c_slider.value * ki), 
+                                      R=ref_rep_slider.value,
+                                      ep_r=ref_ep_slider.value, ka=ka, ki=ki,
+                                      ep_ai=ep_ai)
 ref_MWC = phd.thermo.MWC(ka=ka, ki=ki, ep_ai=ep_ai, effector_conc=ref_c_slider.value)
 
-arch_point = phd.thermo.SimpleRepression(R=rep_slider.value, ep_r=ep_slider.value,
-                                       ka=ka, ki=ki, ep_ai=ep_ai, 
-                                       effector_conc=10**(c_slider.value * ki))
+point = talktools.thermo.evaluate(10**(c_slider.value * ki), 
+                                  R=rep_slider.value, ep_r=ep_slider.value,
+                                  ka=ka, ki=ki, ep_ai=ep_ai,
+                                  ref_bohr=ref_point['bohr_parameter'])
 MWC = phd.thermo.MWC(ka=ka, ki=ki, ep_ai=ep_ai, effector_conc = c_range)
 ref_arch_curve = phd.thermo.SimpleRepression(R=ref_rep_slider.value, ep_r=ref_ep_slider.value,
                                        ka=ka, ki=ki, ep_ai=ep_ai, 
@@ -65,11 +70,11 @@ induction_source = ColumnDataSource({'c':c_range,
                                      'fc_ref':ref_fc})
 
 # Define the point sources.
-ref_fc_point = ref_arch_point.fold_change()
-fc_point = arch_point.fold_change()
-ref_bohr = ref_arch_point.bohr_parameter()
-bohr = arch_point.bohr_parameter()
-delF = bohr - ref_bohr
+ref_fc_point = ref_point['fold_change']
+fc_point = point['fold_change']
+ref_bohr = ref_point['bohr_parameter']
+bohr = point['bohr_parameter']
+delF = point['delta_bohr']
 point_source = ColumnDataSource({'c':[10**(c_slider.value * ki)],
                                  'c_ki':[c_slider.value],
                                  'c_ref':[10**(ref_c_slider.value * ki)],
@@ -135,7 +140,7 @@ p_dF_ep = bokeh.plotting.figure(width=plot_width, height=plot_height,
 
 # Invariant master curve
 bohr_range = np.linspace(-15, 15,  n_points)
-master_curve = (1 + np.exp(-bohr_range))**-1
+master_curve = talktools.thermo.master_curve(bohr_range)
 p_bohr.line(bohr_range, master_curve, color=colors['black'], line_width=2)
 
 # delF curves 
@@ -1,7 +1,7 @@
 #%%
+import sys
 import numpy as np
 import pandas as pd 
-import pickle
 import phd.viz 
 import holoviews as hv
 import altair as alt
@@ -10,30 +10,19 @@ import bokeh.plotting
 hv.extension('bokeh')
 _ = phd.viz.altair_theme()
 colors, palette = phd.viz.bokeh_theme()
-DATA_DIR = '../../../data'
+sys.path.insert(0, '../../../')
+import talktools.predictions
+import talktools.data
+import talktools.chains
 
 # %%
 # Load the sampler information
-with open(f'{DATA_DIR}/SI_I_O2_R260.pkl', 'rb') as f:
-    unpickler = pickle.Unpickler(f)
-    gauss_flatchain = unpickler.load()
-    ka = np.exp(-gauss_flatchain[:, 0][::100])
-    ki = np.exp(-gauss_flatchain[:, 1][::100])
-
-# Load the experimental data
-data = pd.read_csv(f'{DATA_DIR}/RazoMejia2018_data.csv', comment='#')
-
-# Make correction for tetramer to dimer
-data = data[(data['repressors'] > 0) & (data['operator'] != 'Oid')].copy()
-data['repressors'] *= 2
-
-# Rename so things make some sense. 
-data.rename(columns={'fold_change_A':'fold_change', 'IPTG_uM':'IPTGuM'},
-            inplace=True)
-
-# Compute the aggregate properties. 
-summary = data.groupby(['operator', 'repressors', 
-                        'IPTGuM'])['fold_change'].agg(('mean', 'sem')).reset_index()
+chain = talktools.chains.load_chain('SI_I_O2_R260', stride=100)
+ka, ki = chain['ka'], chain['ki']
+
+# Load the aggregate properties of the experimental data
+summary = talktools.data.load_dataset('wt_summary')
+summary = summary[summary['operator'] != 'Oid'].copy()
 summary.rename(columns={'mean':'fc_mean', 'sem':'fc_sem'}, inplace=True)
 
 summary['fc_min'] = summary['fc_mean'].values - summary['fc_sem'].values
@@ -69,24 +58,11 @@ energies = {'O1': -15.3, 'O2': -13.9, 'O3': -9.7}
 sampling_df = pd.DataFrame(np.array([ka, ki]).T, 
                           columns=['ka', 'ki'])
 
-# Set up the dataframe for the fold-change. 
-fc_df = pd.DataFrame()
-
-# Iterate through each operator, repressor, and IPTG concentration to calculate
-# the fold-change
-for op, op_en in energies.items():
-    for r, _ in rep_colors.items():
-        for i, c in enumerate(c_range):
-            arch = phd.thermo.SimpleRepression(r, op_en, ka=ka, ki=ki, 
-                                               ep_ai=4.5, effector_conc=c)
-            
-            fc_min, fc_max = phd.stats.compute_hpd(arch.fold_change(), 0.95)
-            fc_df = fc_df.append({'fc_min': fc_min,
-                                  'fc_max': fc_max,
-                                  'repressors': r,
-                                  'IPTGuM': c,
-                                  'operator': op,
-                                  'binding_energy': op_en}, ignore_index=True)
+# Compute the fold-change credible regions for each operator, repressor, and
+# IPTG concentration
+fc_df = talktools.predictions.induction_table(energies, list(rep_colors.keys()),
+                                              c_range, {'ka':ka, 'ki':ki},
+                                              0.95, ep_ai=4.5)
 
 
 
@@ -1,10 +1,13 @@
 #%%
+import sys
 import numpy as np
 import pandas as pd
 import cmdstanpy 
+sys.path.insert(0, '../../../')
+import talktools.data
 
 # Load the data
-data = pd.read_csv('../../../data/RazoMejia2018_data.csv')
+data = talktools.data.load_dataset('RazoMejia2018')
 data = data[data['repressors'] > 0]
 model = cmdstanpy.CmdStanModel('infer_empirical_F.stan')
 
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 #%%
+import sys
 import numpy as np
 from bokeh.themes import Theme
 import phd.viz
@@ -11,6 +12,8 @@ from bokeh.models import ColumnDataSource, Div, CustomJS, CDSView, IndexFilter
 from bokeh.layouts import layout, widgetbox
 from bokeh.models.widgets import Select, Slider, RadioButtonGroup, Button
 from bokeh.embed import components
+sys.path.insert(0, '../../../')
+import talktools.thermo
 phd.viz.bokeh_theme()
 colors, palette = phd.viz.phd_style()
 bokeh.plotting.output_file("../figs/fixed_wt_model_explorer.html", mode='inline')
@@ -28,11 +31,10 @@ ref_Ki = 1
 ref_epAI = 5
 
 # Set the reference induction profile
-ref_arch = phd.thermo.SimpleRepression(R=ref_R, ep_r=ref_epRA, effector_conc=c_range,
-                                    ka=ref_Ka, ki=ref_Ki, ep_ai=ref_epAI, 
-                                    n_sites=2)
-ref_fc = ref_arch.fold_change()
-ref_bohr = ref_arch.bohr_parameter()
+ref_arch = talktools.thermo.evaluate(c_range, R=ref_R, ep_r=ref_epRA, ka=ref_Ka,
+                                     ki=ref_Ki, ep_ai=ref_epAI, n_sites=2)
+ref_fc = ref_arch['fold_change']
+ref_bohr = ref_arch['bohr_parameter']
 ref_delta_bohr = ref_bohr - ref_bohr
 
 # Define the source
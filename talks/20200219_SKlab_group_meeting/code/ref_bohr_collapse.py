@@ -1,4 +1,5 @@
 #%%
+import sys
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -6,11 +7,13 @@ import phd.stats
 import phd.thermo
 import phd.viz
 import seaborn as sns
+sys.path.insert(0, '../../../')
+import talktools.data
 colors, palette = phd.viz.phd_style()
 viridis = sns.color_palette('viridis', n_colors=4)
 
 # Load the data and restrict
-data = pd.read_csv('../../../data/RazoMejia2018_data.csv')
+data = talktools.data.load_dataset('RazoMejia2018')
 data = data[(data['repressors'] > 0) & (data['fold_change_A'] < 0.99) & 
         (data['fold_change_A']>0.01)]
 
@@ -0,0 +1,25 @@
+"""
+Shared numerical utilities for the figure-generating scripts in `talks/`.
+
+The talk scripts are written against the `phd` package for styling and the
+object-oriented thermodynamic models. The modules here provide vectorized,
+function-based counterparts for the heavy lifting (credible regions over
+posterior chains, parameter sweeps) so figures can be rebuilt quickly. Scripts
+in `talks/<date>/code/` can make the package importable with
+
+    import sys
+    sys.path.insert(0, '../../../')
+    import talktools
+"""
+from . import constants
+from . import data
+from . import chains
+from . import thermo
+from . import stats
+from . import cache
+from . import predictions
+from . import parallel
+from . import grids
+from . import design
+from . import sensitivity
+from . import panels
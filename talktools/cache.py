@@ -0,0 +1,193 @@
+"""
+Persistent on-disk cache for computed credible bands.
+
+Bands are content-addressed: the key is a hash of the posterior samples, the
+model and its bound parameters, the concentration grid and the probability
+mass. Results are stored as compressed `.npz` files and the least recently
+used entries are evicted once the cache exceeds its size budget, so a
+restyle-only figure rebuild never repeats the thermodynamic computation.
+
+The key also covers `CACHE_VERSION` and the bytecode of the model function.
+An edit to the model itself gives new keys. Bump `CACHE_VERSION` after
+changing anything the model calls, e.g. `talktools.thermo.pact`. Stale
+entries are not reused after that, and they are evicted over time. To drop
+them at once, call `BandCache().clear()` or delete `.cache/bands`.
+"""
+import functools
+import hashlib
+import numbers
+import os
+import numpy as np
+from . import data
+from . import stats
+
+CACHE_DIR = data.cache_dir('bands')
+
+# Part of every key. Bump when the thermodynamic models change.
+CACHE_VERSION = '1'
+
+
+class BandCache(object):
+    """
+    A directory of cached credible bands with least-recently-used eviction.
+
+    Parameters
+    ----------
+    directory : str
+        Path to the cache directory. It is created if it does not exist.
+        Default is `.cache/bands` at the root of the repository.
+    max_bytes : int
+        The total size of cached files above which the least recently used
+        entries are deleted. Default is 512 MB.
+    """
+    def __init__(self, directory=CACHE_DIR, max_bytes=512 * 2**20):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path(self, key):
+        """Returns the file path of the entry for `key`."""
+        return os.path.join(self.directory, f'{key}.npz')
+
+    def load(self, key):
+        """
+        Returns the cached band for `key`, or None if it is not cached.
+        Reading an entry marks it as recently used.
+        """
+        path = self.path(key)
+        try:
+            with np.load(path) as f:
+                band = f['band']
+        except (FileNotFoundError, OSError, KeyError, ValueError):
+            return None
+        os.utime(path)
+        return band
+
+    def save(self, key, band):
+        """Stores `band` under `key` and evicts old entries if needed."""
+        data.write_atomic(self.path(key),
+                          lambda f: np.savez_compressed(f, band=band))
+        self.evict()
+
+    def evict(self):
+        """Deletes least recently used entries until under `max_bytes`."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.npz'):
+                st = os.stat(os.path.join(self.directory, name))
+                entries.append((st.st_mtime, st.st_size, name))
+        total = sum(e[1] for e in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(os.path.join(self.directory, name))
+            total -= size
+
+    def clear(self):
+        """Deletes every entry in the cache."""
+        for name in os.listdir(self.directory):
+            if name.endswith('.npz'):
+                os.remove(os.path.join(self.directory, name))
+
+
+def band_key(model, chain, c_grid, mass, dtype=None):
+    """
+    Returns the content hash identifying a credible band. Arguments are as
+    in `talktools.stats.credible_band`.
+    """
+    h = hashlib.blake2b(digest_size=20)
+    _update(h, CACHE_VERSION)
+    _update(h, _describe_model(model))
+    for k in sorted(chain):
+        _update(h, k)
+        _update(h, np.asarray(chain[k]))
+    _update(h, np.asarray(c_grid))
+    # The shape keeps a scalar mass apart from a one-element list, which
+    # gives an extra leading axis.
+    _update(h, np.asarray(mass, dtype=float))
+    _update(h, np.dtype(dtype or np.float64).str)
+    return h.hexdigest()
+
+
+def cached_credible_band(model, chain, c_grid, mass=0.95, cache=None,
+                         max_bytes=None, dtype=None):
+    """
+    Computes a credible band with `talktools.stats.credible_band`, reusing
+    a previously stored result when the inputs are unchanged.
+
+    Parameters
+    ----------
+    model, chain, c_grid, mass :
+        As in `talktools.stats.credible_band`. `model` should be a plain
+        function or a `functools.partial` so that its parameters can be
+        included in the cache key.
+    cache : BandCache or None
+        The cache to use. If None, a `BandCache` in the default location is
+        used.
+    max_bytes, dtype :
+        As in `credible_band`. `dtype` is part of the cache key, while
+        `max_bytes` does not change the result and is not.
+
+    Returns
+    -------
+    cred_region : array
+        The credible region as returned by `credible_band`.
+    """
+    if cache is None:
+        cache = BandCache()
+    key = band_key(model, chain, c_grid, mass, dtype)
+    band = cache.load(key)
+    if band is None:
+        band = stats.credible_band(model, chain, c_grid, mass,
+                                   max_bytes=max_bytes, dtype=dtype)
+        cache.save(key, band)
+    return band
+
+
+def _describe_model(model):
+    """
+    Returns a hashable description of a model callable, including any
+    arguments bound with `functools.partial` and the bytecode and constants
+    of the function.
+    """
+    if isinstance(model, functools.partial):
+        args = tuple(_scalar(v) for v in model.args)
+        keywords = tuple((k, _scalar(v))
+                         for k, v in sorted(model.keywords.items()))
+        return (_describe_model(model.func), args, keywords)
+    name = getattr(model, '__qualname__', None)
+    if name is None or '<lambda>' in name or '<locals>' in name:
+        raise ValueError('Cannot build a cache key for an anonymous model. '
+                         'Use a module-level function or functools.partial.')
+    code = getattr(model, '__code__', None)
+    if code is None:
+        return (model.__module__, name)
+    return (model.__module__, name, code.co_code, repr(code.co_consts))
+
+
+def _scalar(value):
+    """
+    Converts numeric scalars to Python floats, so that e.g. `R=260`,
+    `R=260.0` and `R=np.int64(260)` give the same key.
+    """
+    if isinstance(value, (numbers.Real, np.integer, np.floating)) and \
+            not isinstance(value, (bool, np.bool_)):
+        return float(value)
+    return value
+
+
+def _update(h, value):
+    """Feeds `value` to the hash `h`, recursing into tuples."""
+    if isinstance(value, np.ndarray):
+        h.update(str((value.dtype.str, value.shape)).encode())
+        h.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (tuple, list)):
+        h.update(b'(')
+        for v in value:
+            _update(h, v)
+        h.update(b')')
+    elif np.ndim(value) > 0:
+        _update(h, np.asarray(value))
+    else:
+        h.update(repr(value).encode())
+        h.update(b';')
@@ -0,0 +1,223 @@
+"""
+A memory-mapped store for the MCMC chains of the induction fits.
+
+The posterior samples in `data/` are pickled arrays of the sampled free
+energies, with one row per sample. The first load of a chain unpickles it
+once, computes the dissociation constants `ka = exp(-ep_a)` and
+`ki = exp(-ep_i)`, and writes every column to a `.npy` file under
+`.cache/chains`, along with thinned copies at the strides in `STRIDES` and a
+JSON file of metadata. Later loads memory-map those files, so no pickle is
+read and nothing is copied until a column is used.
+
+Each column is stored contiguously, so `chain['ka']` is a view of one block
+of the file. An entry is rebuilt when its source pickle changes.
+"""
+import json
+import os
+import pickle
+import re
+import numpy as np
+from . import data
+
+CHAIN_DIR = data.cache_dir('chains')
+
+# Thinned copies written at ingest. Other strides are sliced from the
+# largest stored stride that divides them.
+STRIDES = (1, 10, 100)
+
+# The sampled parameters in the order of the pickled columns.
+PARAMS = ('ep_a', 'ep_i', 'sigma')
+
+# Bump when the layout of the stored chains changes.
+_VERSION = 1
+
+# The strain fit by each chain that is not named SI_I_{operator}_R{repressors}.
+_STRAINS = {'main_text_KaKi': ('O2', 260)}
+
+# The start of a Git LFS pointer left in place of a file not yet fetched.
+_LFS_HEADER = b'version https://git-lfs'
+
+
+class Chain(object):
+    """
+    The samples of one MCMC chain with named columns.
+
+    Parameters
+    ----------
+    values : 2-D array
+        The samples with shape (n_columns, n_samples), usually a read-only
+        memory map.
+    columns : tuple of str
+        The name of each row of `values`.
+    metadata : dict
+        The operator, repressor copy number, stride and source of the chain.
+    """
+    def __init__(self, values, columns, metadata):
+        self.values = values
+        self.columns = tuple(columns)
+        self.metadata = metadata
+
+    def __getitem__(self, column):
+        if column not in self.columns:
+            raise KeyError(f'Unknown column {column}. Available columns are '
+                           f'{list(self.columns)}.')
+        return self.values[self.columns.index(column)]
+
+    def __len__(self):
+        return self.values.shape[1]
+
+    def __repr__(self):
+        return (f'<Chain {self.metadata["name"]} ({len(self)} samples, '
+                f'stride {self.metadata["stride"]})>')
+
+
+def load_chain(name, stride=1):
+    """
+    Loads an MCMC chain from the chain store, ingesting its pickle on first
+    use.
+
+    Parameters
+    ----------
+    name : str
+        The file name of the pickled chain in `data/` without the extension,
+        e.g. 'SI_I_O2_R260' or 'main_text_KaKi'.
+    stride : int
+        Keep every `stride`-th sample. Strides in `STRIDES` are read from
+        their own contiguous files.
+
+    Returns
+    -------
+    chain : Chain
+        The samples, with columns for the sampled parameters followed by `ka`
+        and `ki`.
+
+    Examples
+    --------
+    >>> chain = load_chain('SI_I_O2_R260', stride=10)
+    >>> fc = talktools.thermo.fold_change(c, R=260, ep_r=-13.9,
+    ...                                   ka=chain['ka'], ki=chain['ki'],
+    ...                                   ep_ai=4.5)
+    """
+    if stride < 1:
+        raise ValueError('stride must be a positive integer.')
+    metadata = _read_metadata(name)
+    if metadata is None:
+        metadata = ingest_chain(name)
+    stored = max(s for s in metadata['strides'] if stride % s == 0)
+    values = np.load(_chain_path(name, stored), mmap_mode='r')
+    values = values[:, ::stride // stored]
+    return Chain(values, metadata['columns'], dict(metadata, stride=stride))
+
+
+def ingest_chain(name, strides=STRIDES, params=PARAMS):
+    """
+    Converts a pickled chain in `data/` into the chain store.
+
+    Parameters
+    ----------
+    name : str
+        The file name of the pickled chain without the extension.
+    strides : tuple of int
+        The strides at which thinned copies are stored. A stride of 1 is
+        always stored.
+    params : tuple of str
+        Names for the pickled columns, in order. Any further columns are
+        named `p3`, `p4` and so on.
+
+    Returns
+    -------
+    metadata : dict
+        The metadata written alongside the chain.
+    """
+    source = _source_path(name)
+    with open(source, 'rb') as f:
+        if f.read(len(_LFS_HEADER)) == _LFS_HEADER:
+            raise FileNotFoundError(f'{source} is a Git LFS pointer. Run '
+                                    '`git lfs pull` to fetch the chain.')
+        f.seek(0)
+        samples = np.asarray(pickle.load(f), dtype=np.float64)
+
+    n_params = samples.shape[1]
+    columns = list(params[:n_params])
+    columns += [f'p{i}' for i in range(len(columns), n_params)]
+    values = np.empty((n_params + 2, len(samples)))
+    values[:n_params] = samples.T
+    values[n_params] = np.exp(-samples[:, 0])
+    values[n_params + 1] = np.exp(-samples[:, 1])
+    columns += ['ka', 'ki']
+
+    strides = sorted(set(strides) | {1})
+    for s in strides:
+        data.write_atomic(_chain_path(name, s),
+                          lambda fh: np.save(fh, values[:, ::s]))
+
+    operator, repressors = _strain(name)
+    metadata = {'name': name, 'operator': operator, 'repressors': repressors,
+                'columns': columns, 'n_samples': len(samples),
+                'strides': strides, 'version': _VERSION,
+                'source': os.path.basename(source),
+                'stat': list(data.source_stat(source)),
+                'sha256': data.file_hash(source)}
+
+    # The metadata is written last, so an entry is only read once complete.
+    _write_metadata(name, metadata)
+    return metadata
+
+
+def _read_metadata(name):
+    """
+    Reads the metadata of a stored chain, or returns None if the entry is
+    missing or out of date with respect to its pickle.
+    """
+    try:
+        with open(_metadata_path(name)) as f:
+            metadata = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    if metadata.get('version') != _VERSION:
+        return None
+    stat = data.check_source(_source_path(name), metadata['stat'],
+                             metadata['sha256'])
+    if stat is None:
+        return None
+    if stat != tuple(metadata['stat']):
+        # Refresh the recorded modification time of an unchanged file.
+        metadata['stat'] = list(stat)
+        _write_metadata(name, metadata)
+    return metadata
+
+
+def _write_metadata(name, metadata):
+    data.write_atomic(_metadata_path(name), lambda fh: fh.write(
+        json.dumps(metadata, indent=2).encode()))
+
+
+def _strain(name):
+    """Returns the operator and repressor copy number fit by a chain."""
+    if name in _STRAINS:
+        return _STRAINS[name]
+    match = re.fullmatch(r'SI_I_(O\w+)_R(\d+)', name)
+    if match is None:
+        return None, None
+    return match.group(1), int(match.group(2))
+
+
+def _source_path(name):
+    """Returns the path of the pickled chain `name`."""
+    path = os.path.join(data.DATA_DIR, f'{name}.pkl')
+    if not os.path.exists(path):
+        available = sorted(os.path.splitext(f)[0]
+                           for f in os.listdir(data.DATA_DIR)
+                           if f.endswith('.pkl'))
+        raise KeyError(f'Unknown chain {name}. Available chains are '
+                       f'{available}.')
+    return path
+
+
+def _chain_path(name, stride):
+    return os.path.join(CHAIN_DIR, f'{name}-{stride}.npy')
+
+
+def _metadata_path(name):
+    return os.path.join(CHAIN_DIR, f'{name}.json')
+
@@ -0,0 +1,111 @@
+"""
+A read-only registry of the physical constants shared across talks.
+
+`load_constants` parses the registry once per process and returns the same
+immutable object on every call, so a batch run over all talks neither
+rebuilds it nor lets one script's edits leak into another figure. Scripts that
+genuinely need a different value ask for it explicitly with
+`load_constants(Oid=-17.3)`, and the override is recorded in the `version`
+of the returned constants.
+"""
+import collections.abc
+import functools
+
+VERSION = '1'
+
+_CONSTANTS = {
+    # Repressor-DNA binding energies in kT
+    'O1': -15.3, 'O2': -13.9, 'O3': -9.7, 'Oid': -17.0,
+
+    # Allosteric parameters of the wild-type repressor
+    'Ka': 139, 'Ki': 0.53, 'ep_AI': 4.5, 'n_sites': 2,
+
+    # Number of nonspecific binding sites
+    'Nns': 4.6E6,
+
+    # Repressor dimers per cell for each RBS variant
+    'HG104': 22, 'RBS1147': 60, 'RBS446': 124, 'RBS1027': 260,
+    'RBS1': 1220, 'RBS1L': 1740}
+
+
+class Constants(collections.abc.Mapping):
+    """
+    An immutable mapping of constant names to values that also supports
+    attribute access, e.g. `constants['Ka']` or `constants.Ka`.
+
+    Parameters
+    ----------
+    values : dict
+        The constants.
+    version : str
+        A label identifying the registry version and any overrides.
+    """
+    __slots__ = ('_values', 'version')
+
+    def __init__(self, values, version):
+        object.__setattr__(self, '_values', dict(values))
+        object.__setattr__(self, 'version', version)
+
+    def __getitem__(self, key):
+        return self._values[key]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getattr__(self, key):
+        # Private names are never constants. Looking them up in `_values`
+        # would recurse while unpickling, before `_values` is set.
+        if key.startswith('_'):
+            raise AttributeError(key)
+        try:
+            return self._values[key]
+        except KeyError:
+            raise AttributeError(key) from None
+
+    def __setattr__(self, key, value):
+        raise TypeError('Constants are read-only. Pass overrides to '
+                        'load_constants instead.')
+
+    def __reduce__(self):
+        return (Constants, (dict(self._values), self.version))
+
+    def __repr__(self):
+        return f'<Constants version {self.version}: {self._values}>'
+
+
+@functools.lru_cache(maxsize=None)
+def _load(overrides):
+    """Builds the constants for a sorted tuple of (name, value) overrides."""
+    values = dict(_CONSTANTS)
+    for key, value in overrides:
+        if key not in values:
+            raise KeyError(f'Cannot override unknown constant {key}.')
+        values[key] = value
+    version = VERSION
+    if overrides:
+        version += '+' + ','.join(f'{k}={v}' for k, v in overrides)
+    return Constants(values, version)
+
+
+def load_constants(**overrides):
+    """
+    Returns the constants used throughout the talks.
+
+    This replaces `phd.thermo.load_constants`. The result is cached, so
+    repeated calls are free and return the same read-only object.
+
+    Parameters
+    ----------
+    overrides :
+        Explicit replacement values for individual constants, e.g.
+        `Oid=-17.3`. Only existing constants can be overridden.
+
+    Returns
+    -------
+    constants : Constants
+        A read-only mapping of constant names to values.
+    """
+    return _load(tuple(sorted(overrides.items())))
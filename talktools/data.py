@@ -0,0 +1,435 @@
+"""
+A single content-addressed store for the data sets shared across talks.
+
+Every talk reads its data from the top-level `data/` directory through
+`load_dataset`, so there is one canonical copy of each file. The manifest
+`data/manifest.json` records the SHA-256 hash and size of every data set,
+which lets `load_dataset(..., verify=True)` catch a file edited in place and
+`find_stale` flag leftover copies elsewhere that no longer match.
+
+The first load of a data set parses the CSV once and stores it column by
+column in an uncompressed `.npz` file under `.cache/datasets`. Later loads
+read only the requested columns from that file. An entry is rebuilt when the
+size or modification time of its source changes and the contents hash
+differs.
+
+With `typed=True`, the columns listed in `SCHEMAS` are loaded as categoricals
+or dates, and numeric columns take the narrowest type that holds every value
+exactly.
+
+Derived data sets such as `wt_tidy` and `wt_summary` are loaded by name in the
+same way. They are computed from their source data sets on first use and
+cached until a source file or the derivation itself changes.
+"""
+import functools
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(ROOT, 'data')
+MANIFEST = os.path.join(DATA_DIR, 'manifest.json')
+
+# Column types of each data set for `load_dataset(..., typed=True)`. Dates
+# are stored in the CSVs as YYYYMMDD integers.
+_SUMMARY = {'categories': ['parameter', 'mutant', 'operator']}
+_STATISTICS = {'categories': ['parameter', 'method', 'operator']}
+SCHEMAS = {
+    'RazoMejia2018': {'categories': ['username', 'operator', 'rbs'],
+                      'dates': ['date']},
+    'RazoMejia2018_2019_full': {'categories': ['method', 'operator']},
+    'compiled': {'categories': ['username', 'mutant', 'operator', 'class'],
+                 'dates': ['date']},
+    'summarized': {'categories': ['class', 'operator', 'mutant']},
+    'Garcia2011_Brewster2014': {'categories': ['author', 'operator']},
+    'DNA_binding_energy_summary': _SUMMARY,
+    'KaKi_epAI_summary': _SUMMARY,
+    'KaKi_only_summary': _SUMMARY,
+    'empirical_F_statistics': {'categories': ['parameter', 'mutant',
+                                             'operator', 'class']},
+    'method_comparison_empirical_F_statistics': _STATISTICS,
+    'wt_empirical_F_statistics': _STATISTICS,
+    'pathological_F_stats': {'categories': ['parameter']},
+    'wt_tidy': {'categories': ['username', 'operator', 'rbs'],
+                'dates': ['date']},
+    'wt_summary': {'categories': ['operator']}}
+
+
+def cache_dir(name):
+    """Returns the directory `.cache/<name>` at the root of the repository."""
+    return os.path.join(ROOT, '.cache', name)
+
+
+CACHE_DIR = cache_dir('datasets')
+
+# Derived data sets, mapping each name to its derivation function, the data
+# sets it reads and a version to bump when the derivation changes.
+DERIVED = {}
+
+
+def file_hash(path, block_size=2**20):
+    """Returns the hex SHA-256 digest of the file at `path`."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def source_stat(path):
+    """Returns the modification time in ns and the size of a file."""
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def check_source(source, stat, sha256):
+    """
+    Checks whether a file has changed since a cache entry was built from it.
+
+    Parameters
+    ----------
+    source : str
+        The path of the file.
+    stat : sequence
+        The modification time and size recorded by `source_stat` when the
+        entry was built.
+    sha256 : str
+        The hash recorded by `file_hash` when the entry was built.
+
+    Returns
+    -------
+    stat : tuple or None
+        None if the contents of `source` changed. Otherwise its current
+        `source_stat`, which differs from the recorded one if the file was
+        touched without changing, so the caller can refresh its entry.
+    """
+    current = source_stat(source)
+    if current == tuple(stat):
+        return current
+    # Touched but possibly unchanged. Only hash the file in that case.
+    if file_hash(source) != sha256:
+        return None
+    return current
+
+
+def write_atomic(path, write):
+    """
+    Calls `write` with a binary file handle and moves the written file to
+    `path`. The file is written to a temporary name in the same directory
+    first, so a concurrent reader never sees a partial file.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as fh:
+            write(fh)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+def build_manifest(directory=DATA_DIR, path=MANIFEST):
+    """
+    Hashes every CSV file in `directory` and writes the manifest.
+
+    Data sets are named by their file name without the extension and without
+    a trailing `_data`, so `RazoMejia2018_data.csv` becomes `RazoMejia2018`.
+    Files whose names are not valid identifiers, such as sync-conflict
+    copies, are skipped.
+
+    Returns
+    -------
+    manifest : dict
+        Maps each data set name to its file name, size in bytes and hash.
+    """
+    manifest = {}
+    for fname in sorted(os.listdir(directory)):
+        stem, ext = os.path.splitext(fname)
+        if ext != '.csv' or not stem.isidentifier():
+            continue
+        name = stem[:-len('_data')] if stem.endswith('_data') else stem
+        fpath = os.path.join(directory, fname)
+        manifest[name] = {'file': fname, 'bytes': os.path.getsize(fpath),
+                          'sha256': file_hash(fpath)}
+    with open(path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+    _manifest.cache_clear()
+    return manifest
+
+
+@functools.lru_cache(maxsize=None)
+def _manifest(path=MANIFEST):
+    """Reads the manifest once per process."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def dataset_path(name, verify=False):
+    """
+    Returns the path of the canonical copy of the data set `name`.
+
+    Parameters
+    ----------
+    name : str
+        The data set name, e.g. 'RazoMejia2018'. See `build_manifest`.
+    verify : bool
+        If True, hash the file and raise a ValueError if it differs from the
+        manifest.
+    """
+    manifest = _manifest()
+    if name not in manifest:
+        raise KeyError(f'Unknown data set {name}. Available data sets are '
+                       f'{sorted(manifest)}.')
+    entry = manifest[name]
+    path = os.path.join(DATA_DIR, entry['file'])
+    if verify and file_hash(path) != entry['sha256']:
+        raise ValueError(f'{path} does not match the manifest. Run '
+                         '`talktools.data.build_manifest()` if the change '
+                         'is intended.')
+    return path
+
+
+def load_dataset(name, columns=None, typed=False, verify=False, cache=True,
+                 **kwargs):
+    """
+    Loads a data set from the shared data store.
+
+    Parameters
+    ----------
+    name : str
+        The data set name, e.g. 'RazoMejia2018', or the name of a derived
+        data set in `DERIVED`, e.g. 'wt_summary'.
+    columns : list of str or None
+        If given, only these columns are read, in this order.
+    typed : bool
+        If True, apply the schema in `SCHEMAS`. Text columns such as
+        `operator` become categoricals, `date` becomes a datetime, and
+        numeric columns are narrowed where no value changes. Grouping on
+        categorical columns is faster and the table takes less memory.
+    verify : bool
+        If True, check the file against its hash in the manifest first.
+    cache : bool
+        If True, serve the data from the binary column cache, creating it on
+        first use. If False, always parse the CSV.
+    kwargs :
+        Additional keyword arguments passed to `pandas.read_csv`. Each
+        distinct set of arguments is cached separately. Not accepted for
+        derived data sets.
+
+    Returns
+    -------
+    data : pandas DataFrame
+        The contents of the data set.
+    """
+    schema = SCHEMAS.get(name, {}) if typed else {}
+    categories = schema.get('categories', [])
+    if name in DERIVED:
+        if kwargs:
+            raise TypeError('Derived data sets take no read_csv arguments.')
+        data = _load_derived(name, columns, categories, cache)
+    elif not cache:
+        data = pd.read_csv(dataset_path(name, verify), usecols=columns,
+                           **kwargs)
+        if columns is not None:
+            data = data[list(columns)]
+        _categorize(data, categories)
+    else:
+        path = dataset_path(name, verify)
+        key = hashlib.blake2b(repr(sorted(kwargs.items())).encode(),
+                              digest_size=8).hexdigest()
+        cached = os.path.join(CACHE_DIR, f'{name}-{key}.npz')
+        data = _read_cache(cached, path, columns, categories)
+        if data is None:
+            data = pd.read_csv(path, **kwargs)
+            _write_cache(cached, path, data)
+            data = _read_cache(cached, path, columns, categories)
+    if typed:
+        _apply_schema(data, schema)
+    return data
+
+
+def _apply_schema(data, schema):
+    """Converts date columns and narrows numeric columns in place."""
+    for c in data.columns:
+        if c in schema.get('dates', []):
+            data[c] = pd.to_datetime(data[c].astype(str), format='%Y%m%d')
+        elif data[c].dtype.kind in 'iu':
+            data[c] = pd.to_numeric(data[c], downcast='integer')
+        elif data[c].dtype.kind == 'f':
+            values = data[c].to_numpy()
+            narrow = values.astype(np.float32)
+            if np.array_equal(narrow, values, equal_nan=True):
+                data[c] = narrow
+
+
+def _read_cache(cached, source, columns, categories=()):
+    """
+    Reads `columns` of a cached data set, or returns None if the entry is
+    missing or out of date with respect to `source`. Text columns named in
+    `categories` are returned as categoricals.
+    """
+    try:
+        f = np.load(cached)
+    except (FileNotFoundError, OSError, ValueError):
+        return None
+    with f:
+        stat = check_source(source, f['__stat__'], str(f['__sha256__']))
+        if stat is None:
+            return None
+        if stat != tuple(f['__stat__']):
+            # Refresh the recorded modification time of an unchanged file.
+            _write_cache(cached, source, _read_columns(f, None))
+        return _read_columns(f, columns, categories)
+
+
+def _read_columns(f, columns, categories=()):
+    """Assembles a DataFrame from the column arrays of an open `.npz`."""
+    names = f['__columns__'].tolist()
+    if columns is None:
+        columns = names
+    data = {}
+    for c in columns:
+        i = names.index(c)
+        values = f[f'c{i}']
+        if f'u{i}' in f.files:
+            # Text is stored as codes into its sorted unique values, with -1
+            # for missing entries.
+            uniques = f[f'u{i}'].astype(object)
+            if c in categories:
+                values = pd.Categorical.from_codes(values, uniques)
+            else:
+                values = np.append(uniques, np.nan)[values]
+        data[c] = values
+    return pd.DataFrame(data, columns=list(columns))
+
+
+def _write_cache(cached, source, data):
+    """
+    Stores each column of `data` as a separate array of an `.npz`, along
+    with the size, modification time and hash of the `source` file if given.
+    """
+    arrays = {'__columns__': np.array(data.columns, dtype=str)}
+    if source is not None:
+        arrays['__stat__'] = np.array(source_stat(source))
+        arrays['__sha256__'] = np.array(file_hash(source))
+    for i, c in enumerate(data.columns):
+        values = data[c].to_numpy()
+        if values.dtype == object:
+            # Store text as integer codes and fixed-width unicode values so
+            # no pickling is needed.
+            values, uniques = pd.factorize(values, sort=True)
+            arrays[f'u{i}'] = np.asarray(uniques, dtype=str)
+        arrays[f'c{i}'] = values
+    write_atomic(cached, lambda fh: np.savez(fh, **arrays))
+
+
+def _categorize(data, categories):
+    """Converts the text columns named in `categories` in place."""
+    for c in set(categories) & set(data.columns):
+        data[c] = data[c].astype(
+            pd.CategoricalDtype(sorted(data[c].dropna().unique())))
+
+
+def _load_derived(name, columns, categories, cache):
+    """Loads a derived data set, computing and caching it if needed."""
+    func = DERIVED[name][0]
+    if not cache:
+        data = func()
+        if columns is not None:
+            data = data[list(columns)]
+        _categorize(data, categories)
+        return data
+
+    cached = os.path.join(CACHE_DIR, f'{name}-{_derived_key(name)}.npz')
+    if not os.path.exists(cached):
+        # Entries computed from earlier versions of the sources are dropped.
+        for old in glob.glob(os.path.join(CACHE_DIR, f'{name}-*.npz')):
+            os.remove(old)
+        _write_cache(cached, None, func())
+    with np.load(cached) as f:
+        return _read_columns(f, columns, categories)
+
+
+def _derived_key(name):
+    """
+    Hashes the version of a derived data set together with the contents of
+    everything it depends on, following derived dependencies recursively.
+    """
+    _, deps, version = DERIVED[name]
+    h = hashlib.blake2b(f'{name}:{version}'.encode(), digest_size=8)
+    for d in deps:
+        key = _derived_key(d) if d in DERIVED else file_hash(dataset_path(d))
+        h.update(key.encode())
+    return h.hexdigest()
+
+
+def _derived(*deps, version='1'):
+    """Registers a derivation function reading the data sets `deps`."""
+    def register(func):
+        DERIVED[func.__name__.lstrip('_')] = (func, deps, version)
+        return func
+    return register
+
+
+@_derived('RazoMejia2018')
+def _wt_tidy():
+    """
+    The wild-type induction measurements with the autofluorescence and
+    constitutive controls removed, repressor counts converted from tetramers
+    to dimers, and columns renamed to `IPTGuM` and `fold_change`.
+    """
+    data = load_dataset('RazoMejia2018')
+    data = data[data['repressors'] > 0].copy()
+    data['repressors'] *= 2
+    data.rename(columns={'IPTG_uM': 'IPTGuM', 'fold_change_A': 'fold_change'},
+                inplace=True)
+    return data.reset_index(drop=True)
+
+
+@_derived('wt_tidy')
+def _wt_summary():
+    """
+    The mean and standard error of the wild-type fold-change for each
+    operator, repressor copy number and IPTG concentration.
+    """
+    data = load_dataset('wt_tidy')
+    summary = data.groupby(['operator', 'binding_energy', 'repressors',
+                            'IPTGuM'])['fold_change'].agg(['mean', 'sem'])
+    return summary.reset_index()
+
+
+def find_stale(root):
+    """
+    Searches `root` for copies of the data sets outside the data store.
+
+    Parameters
+    ----------
+    root : str
+        The directory to search recursively, e.g. the repository root.
+
+    Returns
+    -------
+    copies : dict
+        Maps the path of every file sharing a file name with a data set to
+        'current' if its contents match the manifest and 'stale' otherwise.
+    """
+    by_file = {e['file']: e['sha256'] for e in _manifest().values()}
+    data_dir = os.path.realpath(DATA_DIR)
+    copies = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+        if os.path.realpath(dirpath) == data_dir:
+            continue
+        for fname in filenames:
+            if fname in by_file:
+                path = os.path.join(dirpath, fname)
+                current = file_hash(path) == by_file[fname]
+                copies[path] = 'current' if current else 'stale'
+    return copies
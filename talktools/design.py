@@ -0,0 +1,116 @@
+"""
+Inverse design of simple-repression strains.
+
+Given target fold-changes or Bohr parameters, these functions return the
+repressor copy number, repressor-DNA binding energy or effector concentration
+that achieves them. The Bohr parameter is linear in log(R) and ep_r, and p_act
+can be inverted in closed form, so every solver is a direct broadcast
+evaluation with no iteration. Thousands of targets against a posterior chain
+are solved in a single call.
+
+Targets that no value of the unknown can reach, such as a fold-change above
+the saturation when solving for the effector concentration, give NaN.
+"""
+import numpy as np
+from . import thermo
+
+
+def bohr_from_fold_change(fold_change):
+    """
+    Computes the Bohr parameter corresponding to a fold-change, the inverse
+    of `talktools.thermo.master_curve`. Fold-changes outside (0, 1) give NaN
+    or infinite values.
+    """
+    fold_change = np.asarray(fold_change, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.log(fold_change) - np.log1p(-fold_change)
+
+
+def target_bohr(fold_change=None, delta_bohr=None, ref_bohr=None):
+    """
+    Converts a design target to a Bohr parameter.
+
+    Parameters
+    ----------
+    fold_change : float, array, or None
+        The target fold-change.
+    delta_bohr : float, array, or None
+        The target free energy shift relative to `ref_bohr`.
+    ref_bohr : float, array, or None
+        The Bohr parameter of the reference state. Required with
+        `delta_bohr`.
+
+    Returns
+    -------
+    bohr : float or array
+        The target Bohr parameter in units of kT.
+    """
+    if (fold_change is None) == (delta_bohr is None):
+        raise ValueError('Specify exactly one of fold_change and delta_bohr.')
+    if fold_change is not None:
+        return bohr_from_fold_change(fold_change)
+    if ref_bohr is None:
+        raise ValueError('ref_bohr is required with delta_bohr.')
+    return np.asarray(ref_bohr) + delta_bohr
+
+
+def solve_repressors(bohr, effector_conc, ep_r, ka, ki, ep_ai, n_sites=2,
+                     n_ns=4.6E6):
+    """
+    Computes the repressor copy number at which the Bohr parameter equals
+    `bohr`.
+
+    Parameters
+    ----------
+    bohr : float or array
+        The target Bohr parameter in kT. See `target_bohr`.
+    effector_conc, ep_r, ka, ki, ep_ai, n_sites, n_ns :
+        The remaining parameters, as in `talktools.thermo.fold_change`. All
+        broadcast against `bohr`.
+
+    Returns
+    -------
+    R : float or array
+        The number of repressors per cell.
+    """
+    log_p = thermo.log_pact(effector_conc, ka, ki, ep_ai, n_sites)
+    return n_ns * np.exp(ep_r - log_p - bohr)
+
+
+def solve_binding_energy(bohr, effector_conc, R, ka, ki, ep_ai, n_sites=2,
+                         n_ns=4.6E6):
+    """
+    Computes the repressor-DNA binding energy at which the Bohr parameter
+    equals `bohr`. Parameters are as in `solve_repressors`, with the copy
+    number `R` given in place of `ep_r`.
+
+    Returns
+    -------
+    ep_r : float or array
+        The binding energy in units of kT.
+    """
+    log_p = thermo.log_pact(effector_conc, ka, ki, ep_ai, n_sites)
+    return bohr + log_p + np.log(R / n_ns)
+
+
+def solve_effector_conc(bohr, R, ep_r, ka, ki, ep_ai, n_sites=2, n_ns=4.6E6):
+    """
+    Computes the effector concentration at which the Bohr parameter equals
+    `bohr`. Parameters are as in `solve_repressors`, with `R` given in place
+    of `effector_conc`.
+
+    Returns
+    -------
+    effector_conc : float or array
+        The effector concentration in the units of `ka` and `ki`. Targets
+        outside the range spanned by the leakiness and the saturation are
+        NaN.
+    """
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        # The target fixes p_act, and with g = (1 + c/ki)/(1 + c/ka),
+        # p_act = (1 + exp(-ep_ai) g^n)^-1 is inverted for g and then c.
+        log_p = -bohr - np.log(R / n_ns) + ep_r
+        g_n = -np.expm1(log_p) * np.exp(ep_ai - log_p)
+        g = g_n**(1 / n_sites)
+        c = ka * ki * (g - 1) / (ka - g * ki)
+    return np.where(c >= 0, c, np.nan)
@@ -0,0 +1,245 @@
+"""
+Concentration grids for evaluating induction profiles.
+"""
+import numpy as np
+
+
+def adaptive_grid(func, c_min=1E-2, c_max=1E4, tol=1E-3, n_init=9,
+                  max_iter=12):
+    """
+    Builds a logarithmically spaced concentration grid that is refined only
+    where `func` changes nonlinearly.
+
+    Starting from `n_init` log-spaced points, the midpoint (in log space) of
+    every interval is evaluated. Intervals where linear interpolation misses
+    the midpoint by more than `tol` are split and checked again, while
+    intervals on the flat leakiness and saturation plateaus are left alone.
+
+    Parameters
+    ----------
+    func : callable
+        Maps a 1-D array of concentrations to an array whose last axis runs
+        over the concentrations, e.g. `talktools.thermo.fold_change` with
+        fixed parameters bound through `functools.partial`, or a function
+        returning the (2, n) output of `talktools.stats.credible_band`.
+    c_min, c_max : float
+        The bounds of the concentration grid. Both must be positive.
+    tol : float
+        The maximum allowed interpolation error at interval midpoints.
+    n_init : int
+        The number of points in the initial grid.
+    max_iter : int
+        The maximum number of refinement rounds. Each round at most halves
+        the spacing of an interval.
+
+    Returns
+    -------
+    c_grid : 1-D array
+        The sorted concentrations at which `func` was evaluated.
+    values : array
+        The values of `func` at `c_grid`.
+    """
+    x = np.linspace(np.log10(c_min), np.log10(c_max), n_init)
+    y = np.asarray(func(10**x))
+    xs, ys = [x], [y]
+
+    # Intervals still to be checked, given by their end points.
+    x_lo, x_hi = x[:-1], x[1:]
+    y_lo, y_hi = y[..., :-1], y[..., 1:]
+    for _ in range(max_iter):
+        if len(x_lo) == 0:
+            break
+        x_mid = 0.5 * (x_lo + x_hi)
+        y_mid = np.asarray(func(10**x_mid))
+        xs.append(x_mid)
+        ys.append(y_mid)
+
+        # Split the intervals whose midpoint is poorly interpolated.
+        err = np.abs(y_mid - 0.5 * (y_lo + y_hi))
+        split = np.max(err.reshape(-1, len(x_mid)), axis=0) > tol
+        x_lo = np.concatenate([x_lo[split], x_mid[split]])
+        x_hi = np.concatenate([x_mid[split], x_hi[split]])
+        y_lo = np.concatenate([y_lo[..., split], y_mid[..., split]], axis=-1)
+        y_hi = np.concatenate([y_mid[..., split], y_hi[..., split]], axis=-1)
+
+    x = np.concatenate(xs)
+    y = np.concatenate(ys, axis=-1)
+    order = np.argsort(x)
+    return 10**x[order], y[..., order]
+
+
+class LabeledArray(object):
+    """
+    An N-D array whose axes are named and carry coordinate values.
+
+    Parameters
+    ----------
+    values : array
+        The data.
+    dims : tuple of str
+        The name of each axis of `values`.
+    coords : dict
+        Maps each name in `dims` to the 1-D array of coordinate values along
+        that axis.
+    """
+    def __init__(self, values, dims, coords):
+        self.values = values
+        self.dims = tuple(dims)
+        self.coords = {d: np.asarray(coords[d]) for d in self.dims}
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self.values, dtype=dtype)
+
+    def __repr__(self):
+        dims = ', '.join(f'{d}: {n}' for d, n in zip(self.dims, self.shape))
+        return f'<LabeledArray ({dims})>'
+
+    def isel(self, **indexers):
+        """
+        Selects by integer position along named axes. Integer indexers drop
+        the axis; slices and arrays keep it.
+        """
+        index, dims, coords = [], [], {}
+        for d in self.dims:
+            idx = indexers.pop(d, slice(None))
+            index.append(idx)
+            if np.ndim(idx) > 0 or isinstance(idx, slice):
+                dims.append(d)
+                coords[d] = self.coords[d][idx]
+        if indexers:
+            raise KeyError(f'Unknown dimensions {list(indexers)}.')
+
+        # Apply one axis at a time so array indexers do not broadcast
+        # against each other.
+        values = self.values
+        for axis in reversed(range(len(index))):
+            key = (slice(None),) * axis + (index[axis],)
+            values = values[key]
+        return LabeledArray(values, dims, coords)
+
+    def sel(self, **indexers):
+        """
+        Selects by coordinate value along named axes, using the nearest
+        coordinate to each requested value.
+        """
+        positions = {}
+        for d, v in indexers.items():
+            if d not in self.coords:
+                raise KeyError(f'Unknown dimension {d}.')
+            c = self.coords[d]
+            pos = np.argmin(np.abs(c[:, np.newaxis] - np.atleast_1d(v)),
+                            axis=0)
+            positions[d] = pos[0] if np.ndim(v) == 0 else pos
+        return self.isel(**positions)
+
+
+def evaluate_grid(func, axes, **fixed):
+    """
+    Evaluates a model over the outer product of named 1-D parameter vectors
+    without materializing a meshgrid.
+
+    Each vector in `axes` is reshaped to lie along its own axis so that
+    NumPy broadcasting produces the full N-D result directly. The memory
+    cost is that of the output alone, rather than one full-size array per
+    parameter as with `np.meshgrid`.
+
+    Parameters
+    ----------
+    func : callable
+        The model, called with keyword arguments only, e.g.
+        `talktools.thermo.fold_change`.
+    axes : dict
+        Maps parameter names of `func` to 1-D arrays of values. The order
+        of the entries sets the order of the output axes.
+    fixed :
+        Scalar parameters passed unchanged to `func`.
+
+    Returns
+    -------
+    result : LabeledArray
+        The model output with one named axis per entry of `axes`.
+
+    Examples
+    --------
+    >>> fc = evaluate_grid(talktools.thermo.fold_change,
+    ...                    {'effector_conc': c_range, 'ka': ka, 'ki': ki},
+    ...                    R=260, ep_r=-13.9, ep_ai=4.5)
+    >>> fc.sel(ka=139, ki=0.53).values
+    """
+    dims = tuple(axes)
+    ndim = len(dims)
+    params = dict(fixed)
+    for i, d in enumerate(dims):
+        shape = [1] * ndim
+        shape[i] = -1
+        params[d] = np.reshape(np.asarray(axes[d]), shape)
+    shape = tuple(len(axes[d]) for d in dims)
+    values = np.broadcast_to(func(**params), shape)
+    return LabeledArray(values, dims, axes)
+
+
+def evaluate_tiled(func, axes, filename=None, max_bytes=64 * 2**20,
+                   dtype=np.float64, **fixed):
+    """
+    Evaluates a model over the outer product of named 1-D parameter vectors
+    in tiles along the first axis, writing each tile into the output as it
+    is computed.
+
+    This is the out-of-core counterpart of `evaluate_grid` for grids too
+    large to hold in memory, such as a 2000 x 2000 x 50 phase diagram. Only
+    one tile of model output exists at a time, and with a `filename` the
+    result is a memory-mapped `.npy` file.
+
+    Parameters
+    ----------
+    func, axes, fixed :
+        As in `evaluate_grid`.
+    filename : str or None
+        If given, the result is written to this `.npy` file and returned as
+        a read-write memory map. Reopen it later with
+        `np.load(filename, mmap_mode='r')`. If None, the result is held in
+        memory.
+    max_bytes : int
+        The approximate size of each tile of output.
+    dtype : numpy dtype
+        The type of the stored result. `np.float32` halves the file size.
+
+    Returns
+    -------
+    result : LabeledArray
+        The model output with one named axis per entry of `axes`.
+
+    Examples
+    --------
+    >>> ka = 139 * np.exp(np.linspace(-5, 5, 2000))
+    >>> ki = 0.53 * np.exp(np.linspace(-5, 5, 2000))
+    >>> delF = evaluate_tiled(talktools.thermo.delta_bohr,
+    ...                       {'ka': ka, 'ki': ki, 'effector_conc': c_range},
+    ...                       filename='delF.npy', dtype=np.float32,
+    ...                       ep_ai=4.5, ka_ref=139, ki_ref=0.53,
+    ...                       ep_ai_ref=4.5)
+    """
+    dims = tuple(axes)
+    shape = tuple(len(axes[d]) for d in dims)
+    if filename is None:
+        values = np.empty(shape, dtype=dtype)
+    else:
+        values = np.lib.format.open_memmap(filename, mode='w+', dtype=dtype,
+                                           shape=shape)
+
+    # Size the tiles by the float64 intermediates of the model.
+    row_bytes = 8 * int(np.prod(shape[1:]))
+    tile = int(max(max_bytes // max(row_bytes, 1), 1))
+    first = np.asarray(axes[dims[0]])
+    for start in range(0, shape[0], tile):
+        tile_axes = dict(axes)
+        tile_axes[dims[0]] = first[start:start + tile]
+        values[start:start + tile] = evaluate_grid(func, tile_axes,
+                                                   **fixed).values
+    if filename is not None:
+        values.flush()
+    return LabeledArray(values, dims, axes)
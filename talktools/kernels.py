@@ -0,0 +1,120 @@
+"""
+Compiled kernels for evaluating induction properties over posterior chains.
+
+If Numba is installed, the kernels are JIT-compiled and parallelized over
+repressor copy numbers. Otherwise an equivalent vectorized NumPy
+implementation is used, so results never depend on Numba being available.
+"""
+import numpy as np
+from . import thermo
+try:
+    import numba
+except ImportError:
+    numba = None
+
+PROPERTIES = ('leakiness', 'saturation', 'dynamic_range', 'EC50',
+              'effective_hill')
+
+
+def induction_properties(R, ep_r, ka, ki, ep_ai, n_sites=2, n_ns=4.6E6):
+    """
+    Computes the leakiness, saturation, dynamic range, EC50 and effective
+    Hill coefficient of the induction profile for every combination of
+    repressor copy number and posterior sample.
+
+    Parameters
+    ----------
+    R : 1-D array
+        The repressor copy numbers per cell.
+    ep_r : float
+        The repressor-DNA binding energy in kT.
+    ka, ki : 1-D arrays
+        Posterior samples of the effector dissociation constants to the
+        active and inactive states.
+    ep_ai : float or 1-D array
+        The energy difference between the active and inactive states in kT,
+        either fixed or one value per sample.
+    n_sites : int or array
+        The number of effector binding sites per repressor. Default is 2.
+    n_ns : float or array
+        The number of nonspecific binding sites. Default is 4.6E6.
+
+    Returns
+    -------
+    props : dict
+        Maps each name in `PROPERTIES` to an array of shape
+        (len(R), len(ka)). If `n_sites` or `n_ns` are arrays, they are
+        broadcast against this shape and extra leading axes are kept.
+    """
+    R = np.atleast_1d(np.asarray(R, dtype=np.float64))
+    ka = np.atleast_1d(np.asarray(ka, dtype=np.float64))
+    ki = np.atleast_1d(np.asarray(ki, dtype=np.float64))
+    ep_ai = np.broadcast_to(np.asarray(ep_ai, dtype=np.float64),
+                            ka.shape).copy()
+    if np.ndim(n_sites) > 0 or np.ndim(n_ns) > 0:
+        # The compiled kernel takes scalar site counts only.
+        props = thermo.compute_properties(R[:, np.newaxis], ep_r, ka, ki,
+                                          ep_ai, n_sites, n_ns)
+        shape = np.broadcast_shapes(np.shape(n_sites), np.shape(n_ns),
+                                    (len(R), len(ka)))
+        return {k: np.broadcast_to(props[k], shape) for k in PROPERTIES}
+    out = np.empty((len(PROPERTIES), len(R), len(ka)))
+    if numba is not None:
+        _properties_jit(R, float(ep_r), ka, ki, ep_ai, float(n_sites),
+                        float(n_ns), out)
+    else:
+        _properties_numpy(R, ep_r, ka, ki, ep_ai, n_sites, n_ns, out)
+    return dict(zip(PROPERTIES, out))
+
+
+def _properties_numpy(R, ep_r, ka, ki, ep_ai, n_sites, n_ns, out):
+    """Vectorized NumPy evaluation of the induction properties."""
+    props = thermo.compute_properties(R[:, np.newaxis], ep_r, ka, ki, ep_ai,
+                                      n_sites, n_ns)
+    for i, k in enumerate(PROPERTIES):
+        out[i] = props[k]
+
+
+def _properties_scalar(R, ep_r, ka, ki, ep_ai, n_sites, n_ns, out):
+    """
+    Loop implementation of `talktools.thermo.compute_properties` compiled by
+    Numba.
+    """
+    # Quantities that depend only on the sample are computed once.
+    n_samples = ka.shape[0]
+    boltz = np.empty(n_samples)
+    pact_0 = np.empty(n_samples)
+    pact_inf = np.empty(n_samples)
+    dg_0 = np.empty(n_samples)
+    for j in range(n_samples):
+        boltz[j] = np.exp(-ep_ai[j])
+        pact_0[j] = 1.0 / (1.0 + boltz[j])
+        pact_inf[j] = 1.0 / (1.0 + boltz[j] * (ka[j] / ki[j])**n_sites)
+        dg_0[j] = n_sites * boltz[j] * (1.0 / ki[j] - 1.0 / ka[j])
+
+    for i in numba.prange(R.shape[0]):
+        k = R[i] / n_ns * np.exp(-ep_r)
+        for j in range(n_samples):
+            leak = 1.0 / (1.0 + k * pact_0[j])
+            sat = 1.0 / (1.0 + k * pact_inf[j])
+            fc_50 = 0.5 * (leak + sat)
+            pact_50 = (1.0 / fc_50 - 1.0) / k
+            y = (1.0 / pact_50 - 1.0) / boltz[j]
+            if n_sites == 2.0:
+                q = np.sqrt(y)
+            else:
+                q = y**(1.0 / n_sites)
+            ec50 = ka[j] * ki[j] * (q - 1.0) / (ka[j] - q * ki[j])
+            x = 1.0 + ec50 / ka[j]
+            dpact = -pact_50**2 * dg_0[j] * (y / q) / (x * x)
+            dfc = -k * dpact * fc_50**2
+            out[0, i, j] = leak
+            out[1, i, j] = sat
+            out[2, i, j] = sat - leak
+            out[3, i, j] = ec50
+            out[4, i, j] = 4.0 * ec50 * dfc / (sat - leak)
+
+
+if numba is not None:
+    _properties_jit = numba.njit(parallel=True, cache=True,
+                                 fastmath=False)(_properties_scalar)
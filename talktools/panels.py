@@ -0,0 +1,126 @@
+"""
+Scoring of effector concentration panels by the information they carry about
+the allosteric parameters.
+
+Each measured concentration contributes a Fisher information matrix built
+from the analytic gradient of the fold-change. The information of a panel is
+the sum over its concentrations, so thousands of candidate panels are scored
+with a single matrix product against the per-concentration contributions.
+"""
+import itertools
+import numpy as np
+from . import thermo
+
+
+def fisher_information(c_grid, R, ep_r, ka, ki, ep_ai, n_sites=2, n_ns=4.6E6,
+                       sigma=0.1, params=('ka', 'ki', 'ep_ai'),
+                       log_params=('ka', 'ki')):
+    """
+    Computes the Fisher information about the allosteric parameters from a
+    single fold-change measurement at each candidate concentration.
+
+    Parameters
+    ----------
+    c_grid : 1-D array
+        The candidate effector concentrations.
+    R, ep_r, ka, ki, ep_ai, n_sites, n_ns :
+        The model parameters, as in `talktools.thermo.fold_change`. Passing
+        posterior samples as 1-D arrays of shape (n_samples,) gives one
+        information matrix per sample.
+    sigma : float
+        The standard deviation of the measurement noise on the fold-change.
+    params : tuple of str
+        The parameters of interest, chosen from
+        `talktools.thermo.GRADIENT_PARAMS`.
+    log_params : tuple of str
+        Parameters in `params` whose information is computed with respect to
+        their logarithm, matching how the dissociation constants are sampled.
+
+    Returns
+    -------
+    info : array
+        The information matrices with shape (..., n_c, n_params, n_params),
+        where the leading axes are those of the broadcast model parameters.
+    """
+    c_grid = np.asarray(c_grid)
+    args = np.broadcast_arrays(R, ep_r, ka, ki, ep_ai, n_sites, n_ns)
+    args = [np.asarray(a)[..., np.newaxis] for a in args]
+    grad = thermo.fold_change_gradient(c_grid, *args)
+    values = dict(zip(thermo.GRADIENT_PARAMS, args[:5] + [c_grid]))
+    jac = []
+    for p in params:
+        g = grad[thermo.GRADIENT_PARAMS.index(p)]
+        jac.append(g * values[p] if p in log_params else g)
+    jac = np.stack(jac, axis=-1) / sigma
+    return jac[..., :, np.newaxis] * jac[..., np.newaxis, :]
+
+
+def candidate_designs(n_c, n_points, n_designs=None, seed=None):
+    """
+    Enumerates candidate panels as sets of indices into a concentration grid.
+
+    Parameters
+    ----------
+    n_c : int
+        The number of candidate concentrations.
+    n_points : int
+        The number of distinct concentrations in each panel.
+    n_designs : int or None
+        If None, every combination is returned. Otherwise this many panels
+        are drawn at random, each with distinct concentrations.
+    seed : int or None
+        Seed for the random draw.
+
+    Returns
+    -------
+    designs : 2-D array
+        Integer array of shape (n_designs, n_points) with sorted indices.
+    """
+    if n_designs is None:
+        return np.array(list(itertools.combinations(range(n_c), n_points)))
+    rng = np.random.default_rng(seed)
+    keys = rng.random((n_designs, n_c))
+    return np.sort(np.argsort(keys, axis=1)[:, :n_points], axis=1)
+
+
+def score_designs(designs, info, prior_cov=None, replicates=1):
+    """
+    Scores candidate panels by their expected information gain.
+
+    Parameters
+    ----------
+    designs : 2-D array
+        Integer array of shape (n_designs, n_points) indexing the
+        concentration axis of `info`. Repeated indices are replicate
+        measurements.
+    info : array
+        The output of `fisher_information`, of shape
+        (..., n_c, n_params, n_params).
+    prior_cov : 2-D array or None
+        The prior covariance of the parameters of interest. If given, the
+        score is the expected information gain 0.5 log det(I + prior_cov F)
+        of the linearized model. If None, the D-optimality criterion
+        0.5 log det F is used.
+    replicates : int
+        The number of measurements at each concentration of a panel.
+
+    Returns
+    -------
+    scores : 1-D array
+        The score of each panel in nats, averaged over the leading axes of
+        `info` such as posterior samples. Higher is better.
+    """
+    designs = np.asarray(designs)
+    n_c, n_params = info.shape[-3], info.shape[-1]
+    counts = np.zeros((len(designs), n_c))
+    np.add.at(counts, (np.arange(len(designs))[:, np.newaxis], designs),
+              replicates)
+
+    # Sum the per-concentration information of each panel as one product.
+    flat = info.reshape(-1, n_c, n_params**2)
+    fisher = np.einsum('dc,sck->dsk', counts, flat)
+    fisher = fisher.reshape(len(designs), -1, n_params, n_params)
+    if prior_cov is not None:
+        fisher = np.eye(n_params) + np.asarray(prior_cov) @ fisher
+    _, logdet = np.linalg.slogdet(fisher)
+    return 0.5 * np.mean(logdet, axis=1)
@@ -0,0 +1,118 @@
+"""
+Process-pool parallelism over independent strain groups.
+
+The posterior chain is copied once into shared memory and every worker maps
+it as read-only arrays, so it is never pickled per task. Results come back
+in the order of the input keys regardless of which worker finishes first.
+"""
+import concurrent.futures
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy as np
+
+# The chain arrays attached in a worker process.
+_CHAIN = {}
+_BLOCKS = []
+
+
+def map_groups(func, keys, chain, processes=None, **kwargs):
+    """
+    Evaluates `func` for each group key in parallel.
+
+    Parameters
+    ----------
+    func : callable
+        A module-level function (or `functools.partial` of one) with
+        signature `func(key, chain, **kwargs)`. It must be picklable, so
+        lambdas and functions defined inside other functions will not work.
+    keys : iterable
+        The group keys, e.g. the `g` of `data.groupby(['repressors',
+        'operator'])` or a list of (repressors, operator) tuples.
+    chain : dict
+        Maps parameter names to arrays of posterior samples. Workers receive
+        read-only views of shared-memory copies of these arrays, and a
+        serial call receives read-only views of the arrays themselves.
+    processes : int or None
+        The number of worker processes. If None, the number of CPUs is used.
+        If 1, `func` is called serially in this process.
+    kwargs :
+        Additional keyword arguments passed to `func`.
+
+    Returns
+    -------
+    results : list
+        The values of `func` in the same order as `keys`.
+
+    Notes
+    -----
+    Workers are started by a fork server, or spawned where that is not
+    available, never forked from the calling process. Calling scripts must
+    therefore guard the call with `if __name__ == '__main__':`, and `func`
+    must be importable from a module.
+    """
+    keys = list(keys)
+    if processes == 1 or len(keys) <= 1:
+        # Give `func` the same read-only arrays it sees in a worker, so code
+        # that mutates the chain fails serially too.
+        chain = {k: _readonly(v) for k, v in chain.items()}
+        return [func(key, chain, **kwargs) for key in keys]
+
+    blocks, specs = _share(chain)
+    try:
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=processes, mp_context=_context(),
+                initializer=_attach, initargs=(specs,)) as pool:
+            futures = [pool.submit(_call, func, key, kwargs) for key in keys]
+            return [f.result() for f in futures]
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
+
+def _context():
+    """
+    Returns a multiprocessing context that starts workers from a clean
+    process. Forking a process that has run a parallel Numba kernel leaves
+    its threading layer in a state that hangs the interpreter at exit.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+def _share(chain):
+    """
+    Copies the arrays of `chain` into shared memory. Returns the blocks and
+    the specification needed to attach to them from another process.
+    """
+    blocks, specs = [], {}
+    for k, v in chain.items():
+        v = np.ascontiguousarray(v)
+        shm = shared_memory.SharedMemory(create=True, size=max(v.nbytes, 1))
+        np.ndarray(v.shape, dtype=v.dtype, buffer=shm.buf)[...] = v
+        blocks.append(shm)
+        specs[k] = (shm.name, v.shape, v.dtype.str)
+    return blocks, specs
+
+
+def _readonly(v):
+    """Returns a read-only view of `v`, leaving `v` itself writable."""
+    v = np.asarray(v).view()
+    v.flags.writeable = False
+    return v
+
+
+def _attach(specs):
+    """Worker initializer mapping the shared chain as read-only arrays."""
+    for k, (name, shape, dtype) in specs.items():
+        shm = shared_memory.SharedMemory(name=name)
+        arr = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        arr.flags.writeable = False
+        _BLOCKS.append(shm)
+        _CHAIN[k] = arr
+
+
+def _call(func, key, kwargs):
+    """Evaluates `func` for a single key against the attached chain."""
+    return func(key, _CHAIN, **kwargs)
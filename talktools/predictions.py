@@ -0,0 +1,186 @@
+"""
+Tidy tables of model predictions over grids of strains and concentrations.
+"""
+import functools
+import numpy as np
+import pandas as pd
+from . import thermo
+from . import stats
+
+
+def induction_table(energies, repressors, c_grid, chain, mass=0.95,
+                    model=thermo.fold_change, max_bytes=None, dtype=None,
+                    log_space=False, **kwargs):
+    """
+    Computes the credible region of the fold-change for every combination of
+    operator, repressor copy number and effector concentration.
+
+    Results are written into preallocated columnar arrays and assembled into
+    a single DataFrame at the end, rather than appending row by row. With
+    the default model, p_act is evaluated once for all strains (see
+    `repression_bands`) unless `log_space` is set.
+
+    Parameters
+    ----------
+    energies : dict
+        Maps operator names to their repressor-DNA binding energies in kT,
+        e.g. {'O1': -15.3, 'O2': -13.9, 'O3': -9.7}.
+    repressors : list
+        The repressor copy numbers per cell.
+    c_grid : 1-D array
+        The effector concentrations in µM.
+    chain : dict
+        Maps parameter names of `model` to 1-D arrays of posterior samples,
+        e.g. {'ka': ka, 'ki': ki}.
+    mass : float with 0 < mass <= 1
+        The probability mass of the credible region. Default is 0.95.
+    model : callable
+        The model evaluated for each strain. It is called with the keyword
+        arguments `R` and `ep_r` in addition to those in `chain` and
+        `kwargs`. Default is `talktools.thermo.fold_change`.
+    max_bytes : int or None
+        Memory budget passed to `talktools.stats.credible_band`.
+    dtype : numpy dtype or None
+        The type in which the model is evaluated, as in
+        `talktools.stats.credible_band`.
+    log_space : bool
+        If True, `model` is called with `log_space=True`, as accepted by
+        `talktools.thermo.fold_change`. Each strain is then evaluated
+        separately.
+    kwargs :
+        Fixed model parameters such as `ep_ai` and scalar `n_sites` and
+        `n_ns`.
+
+    Returns
+    -------
+    df : pandas DataFrame
+        A tidy DataFrame with one row per (operator, repressors, IPTGuM)
+        and columns `fc_min`, `fc_max`, `repressors`, `IPTGuM`, `operator`
+        and `binding_energy`.
+    """
+    c_grid = np.asarray(c_grid)
+    n_c = len(c_grid)
+    n_rows = len(energies) * len(repressors) * n_c
+
+    # Preallocate every column.
+    fc_min = np.empty(n_rows)
+    fc_max = np.empty(n_rows)
+    reps = np.empty(n_rows, dtype=np.asarray(repressors).dtype)
+    iptg = np.empty(n_rows)
+    ops = np.empty(n_rows, dtype=object)
+    eps = np.empty(n_rows)
+
+    # The default model shares p_act across all strains.
+    shared = model is thermo.fold_change and not log_space
+    if shared:
+        bands = repression_bands(c_grid, chain, repressors,
+                                 list(energies.values()), mass,
+                                 max_bytes=max_bytes, dtype=dtype, **kwargs)
+    elif log_space:
+        kwargs['log_space'] = True
+
+    row = 0
+    for j, (op, op_en) in enumerate(energies.items()):
+        for i, r in enumerate(repressors):
+            if shared:
+                band = bands[i, j]
+            else:
+                _model = functools.partial(model, R=r, ep_r=op_en, **kwargs)
+                band = stats.credible_band(_model, chain, c_grid, mass,
+                                           max_bytes=max_bytes, dtype=dtype)
+            block = slice(row, row + n_c)
+            fc_min[block], fc_max[block] = band
+            reps[block] = r
+            iptg[block] = c_grid
+            ops[block] = op
+            eps[block] = op_en
+            row += n_c
+
+    return pd.DataFrame({'fc_min': fc_min, 'fc_max': fc_max,
+                         'repressors': reps, 'IPTGuM': iptg,
+                         'operator': ops, 'binding_energy': eps})
+
+
+def repression_bands(c_grid, chain, R, ep_r, mass=0.95, n_sites=2,
+                     n_ns=4.6E6, max_bytes=None, dtype=None, **kwargs):
+    """
+    Computes fold-change credible regions for every combination of repressor
+    copy number and binding energy from a single evaluation of p_act.
+
+    The allosteric parameters and the effector concentration enter the
+    fold-change only through p_act, and the fold-change is a decreasing
+    function of p_act for any repressor copy number and binding energy.
+    p_act is therefore computed and sorted once over the chain. Each strain
+    then costs a single broadcast arithmetic pass over the sorted samples,
+    with no further sorting. Results agree with `credible_band` to within
+    floating-point rounding.
+
+    Parameters
+    ----------
+    c_grid : 1-D array
+        The effector concentrations.
+    chain : dict
+        Maps allosteric parameter names (`ka`, `ki` and optionally `ep_ai`)
+        to 1-D arrays of posterior samples.
+    R : 1-D array
+        The repressor copy numbers per cell.
+    ep_r : 1-D array
+        The repressor-DNA binding energies in kT.
+    mass : float with 0 < mass <= 1
+        The probability mass of the credible region. Default is 0.95.
+    n_sites : float
+        The number of effector binding sites per repressor. Default is 2.
+        Must be a scalar, as must `n_ns`, since every strain shares one
+        sorted p_act.
+    n_ns : float
+        The number of nonspecific binding sites. Default is 4.6E6.
+    max_bytes : int or None
+        Upper bound on the memory used for the p_act and fold-change
+        samples and their credible regions. If None, the whole grid is
+        evaluated at once.
+    dtype : numpy dtype or None
+        If given, p_act and the fold-change samples are computed in this
+        type, e.g. `np.float32` to halve memory use.
+    kwargs :
+        Fixed allosteric parameters not given in `chain`, such as `ep_ai`.
+
+    Returns
+    -------
+    bands : array, shape (len(R), len(ep_r), 2, len(c_grid))
+        The lower and upper bounds of the credible region for each strain.
+    """
+    if np.ndim(n_sites) > 0 or np.ndim(n_ns) > 0:
+        raise ValueError('repression_bands takes scalar n_sites and n_ns. '
+                         'Use talktools.stats.credible_band for arrays.')
+    c_grid = np.asarray(c_grid)[:, np.newaxis]
+    R = np.atleast_1d(R)
+    ep_r = np.atleast_1d(ep_r)
+    params = {k: np.asarray(v)[np.newaxis, :] for k, v in chain.items()}
+    params.update(kwargs)
+    n_samples = stats._n_samples(chain)
+    itemsize = np.dtype(dtype or np.float64).itemsize
+    # Each grid row holds the sorted p_act samples, up to three fold-change
+    # temporaries and the HPD widths.
+    chunk_size = stats._chunk_size(max_bytes, n_samples, len(c_grid),
+                                   itemsize, n_arrays=6)
+
+    # Repression prefactor of each strain, fold-change = (1 + k * pact)^-1
+    k = (R[:, np.newaxis] / n_ns) * np.exp(-ep_r)[np.newaxis, :]
+    if dtype is not None:
+        k = k.astype(dtype)
+
+    bands = np.empty((len(R), len(ep_r), 2, len(c_grid)))
+    for start in range(0, len(c_grid), chunk_size):
+        chunk = slice(start, start + chunk_size)
+        _c = c_grid[chunk]
+        p = np.array(np.broadcast_to(
+                     thermo.pact(_c, n_sites=n_sites, dtype=dtype, **params),
+                     (len(_c), n_samples)))
+        p.sort(axis=-1)
+
+        # Descending p_act is ascending fold-change.
+        p = p[..., ::-1]
+        for i, j in np.ndindex(k.shape):
+            fc = (1 + k[i, j] * p)**-1
+            bands[i, j, :, chunk] = stats.sorted_hpds(fc, [mass])[0]
+    return bands
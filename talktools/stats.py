@@ -0,0 +1,181 @@
+"""
+Credible-region calculations over posterior samples.
+"""
+import numpy as np
+
+
+def compute_hpd(trace, mass_frac, axis=0):
+    """
+    Returns the highest probability density region given by a set of samples.
+
+    This is the axis-aware generalization of `phd.stats.compute_hpd`. For a
+    1-D `trace` the result is identical; for N-D input every HPD along `axis`
+    is computed from a single sort.
+
+    Parameters
+    ----------
+    trace : array
+        MCMC samples. Samples are taken along `axis`.
+    mass_frac : float with 0 < mass_frac <= 1
+        The fraction of the probability to be included in the HPD. For
+        example, `mass_frac` = 0.95 gives a 95% HPD.
+    axis : int
+        The axis of `trace` along which the samples lie. Default is 0.
+
+    Returns
+    -------
+    hpd : array, shape (2, ...)
+        The lower and upper bounds of the HPD. The trailing dimensions are
+        those of `trace` with `axis` removed.
+    """
+    return compute_hpds(trace, [mass_frac], axis=axis)[0]
+
+
+def compute_hpds(trace, mass_fracs, axis=0):
+    """
+    Returns the highest probability density regions for several probability
+    masses from a single sort of the samples.
+
+    Parameters
+    ----------
+    trace : array
+        MCMC samples. Samples are taken along `axis`.
+    mass_fracs : list of floats with 0 < mass_frac <= 1
+        The fractions of the probability to be included in each HPD, e.g.
+        [0.5, 0.95, 0.99].
+    axis : int
+        The axis of `trace` along which the samples lie. Default is 0.
+
+    Returns
+    -------
+    hpds : array, shape (len(mass_fracs), 2, ...)
+        The lower and upper bounds of the HPD for each mass fraction. The
+        trailing dimensions are those of `trace` with `axis` removed.
+    """
+    # Sorting is far faster along a contiguous last axis. Copy once into that
+    # layout and sort in place.
+    d = np.array(np.moveaxis(trace, axis, -1), order='C')
+    d.sort(axis=-1)
+    return sorted_hpds(d, mass_fracs)
+
+
+def sorted_hpds(d, mass_fracs):
+    """
+    Returns the highest probability density regions of samples that are
+    already sorted in ascending order along the last axis. See
+    `compute_hpds` for details.
+    """
+    n = d.shape[-1]
+    hpds = np.empty((len(mass_fracs), 2) + d.shape[:-1], dtype=d.dtype)
+    for i, mass_frac in enumerate(mass_fracs):
+        if not 0 < mass_frac <= 1:
+            raise ValueError('mass_frac must satisfy 0 < mass_frac <= 1.')
+        if mass_frac == 1:
+            # The whole range of the samples.
+            hpds[i, 0], hpds[i, 1] = d[..., 0], d[..., -1]
+            continue
+
+        # Number of samples to be included in the HPD
+        n_samples = int(np.floor(mass_frac * n))
+
+        # Find the narrowest interval containing n_samples samples
+        int_width = d[..., n_samples:] - d[..., :n - n_samples]
+        min_int = np.argmin(int_width, axis=-1)[..., np.newaxis]
+        upper_int = min_int + n_samples
+        hpds[i, 0] = np.take_along_axis(d, min_int, axis=-1)[..., 0]
+        hpds[i, 1] = np.take_along_axis(d, upper_int, axis=-1)[..., 0]
+    return hpds
+
+
+def credible_band(model, chain, c_grid, mass=0.95, max_bytes=None,
+                  dtype=None):
+    """
+    Computes the credible region of a model prediction over a grid of
+    effector concentrations.
+
+    By default the full (concentrations x samples) matrix is evaluated at
+    once. For long, unthinned chains pass `max_bytes` to stream over the
+    concentration grid in chunks instead; the result is identical.
+
+    Parameters
+    ----------
+    model : callable
+        A function with signature `model(effector_conc, **params)` returning
+        a broadcast array, such as `talktools.thermo.fold_change` with the
+        fixed parameters bound through `functools.partial`.
+    chain : dict
+        Maps parameter names of `model` to 1-D arrays of posterior samples,
+        all of the same length.
+    c_grid : 1-D array
+        The effector concentrations at which to evaluate the model.
+    mass : float or list of floats with 0 < mass <= 1
+        The probability mass of the credible region. Default is 0.95. If a
+        list is given, all regions are computed from one sort of the samples.
+    max_bytes : int or None
+        Upper bound on the memory used for model evaluations and sorting,
+        counting the temporaries of the `talktools.thermo` models. Models
+        with more intermediate arrays may exceed it. If None (default), the
+        whole grid is evaluated in one pass.
+    dtype : numpy dtype or None
+        If given, the chain and grid are cast to this type and it is passed
+        on to `model`, e.g. `np.float32` with a `talktools.thermo` model
+        evaluated with `log_space=True`.
+
+    Returns
+    -------
+    cred_region : array, shape (2, len(c_grid))
+        The lower and upper bounds of the credible region at each
+        concentration. If `mass` is a list, the shape is
+        (len(mass), 2, len(c_grid)).
+
+    Examples
+    --------
+    >>> model = functools.partial(talktools.thermo.fold_change, R=260,
+    ...                           ep_r=-13.9, ep_ai=4.5)
+    >>> cred_region = credible_band(model, {'ka': ka, 'ki': ki}, c_range)
+    """
+    # Concentrations run down the rows and samples across the columns so
+    # that each HPD sort is over contiguous memory.
+    params = {k: np.asarray(v, dtype=dtype)[np.newaxis, :]
+              for k, v in chain.items()}
+    c_grid = np.asarray(c_grid, dtype=dtype)[:, np.newaxis]
+    if dtype is not None:
+        params['dtype'] = dtype
+    n_samples = _n_samples(chain)
+    itemsize = np.dtype(dtype or np.float64).itemsize
+    # Each grid row holds up to three model temporaries of a `thermo` model,
+    # the evaluated samples, their sorted copy and the HPD widths.
+    chunk_size = _chunk_size(max_bytes, n_samples, len(c_grid), itemsize,
+                             n_arrays=5)
+    masses = np.atleast_1d(mass)
+
+    cred_region = np.empty((len(masses), 2, len(c_grid)))
+    for start in range(0, len(c_grid), chunk_size):
+        _c = c_grid[start:start + chunk_size]
+        values = np.broadcast_to(model(_c, **params), (len(_c), n_samples))
+        chunk = slice(start, start + chunk_size)
+        cred_region[..., chunk] = compute_hpds(values, masses, axis=-1)
+    if np.ndim(mass) == 0:
+        return cred_region[0]
+    return cred_region
+
+
+def _n_samples(chain):
+    """Returns the common length of the sample arrays in `chain`."""
+    lengths = {len(v) for v in chain.values()}
+    if len(lengths) != 1:
+        raise ValueError('All parameter chains must have the same length.')
+    return lengths.pop()
+
+
+def _chunk_size(max_bytes, n_samples, n_rows, itemsize=8, n_arrays=2):
+    """
+    Returns the number of grid rows that can be evaluated at once without
+    exceeding `max_bytes`, when each row needs `n_arrays` arrays of
+    `n_samples` values alive at the same time. At least one row is always
+    evaluated.
+    """
+    if max_bytes is None:
+        return max(n_rows, 1)
+    row_bytes = n_arrays * n_samples * itemsize
+    return int(min(max(max_bytes // row_bytes, 1), max(n_rows, 1)))
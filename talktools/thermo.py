@@ -0,0 +1,345 @@
+"""
+Vectorized thermodynamic models for simple repression with an allosteric
+repressor.
+
+These functions mirror `phd.thermo.MWC` and `phd.thermo.SimpleRepression` but
+take every parameter as a broadcastable array rather than building a new
+object for each parameter value. A posterior chain of shape (n_samples, 1)
+evaluated against a concentration grid of shape (n_c,) therefore yields the
+full (n_samples, n_c) matrix in a single call. This includes `n_sites` and
+`n_ns`, so architectures with different numbers of effector binding sites or
+nonspecific sites are compared in one call as well.
+
+Every function accepts an optional `dtype`. Passing `np.float32` casts all
+inputs before evaluation, halving the memory and bandwidth of chain-sized
+evaluations. Use it together with `log_space=True`, which computes through
+log1p and logaddexp so that extreme energies neither overflow nor lose
+precision.
+"""
+import numpy as np
+
+# The order of the derivatives returned by `bohr_gradient` and
+# `fold_change_gradient`.
+GRADIENT_PARAMS = ('R', 'ep_r', 'ka', 'ki', 'ep_ai', 'effector_conc')
+
+
+def pact(effector_conc, ka, ki, ep_ai, n_sites=2, dtype=None):
+    """
+    Computes the probability that a repressor is in the active state.
+
+    Parameters
+    ----------
+    effector_conc : float or array
+        The concentration of the effector molecule.
+    ka, ki : float or array
+        The dissociation constants of the effector to the active and inactive
+        states of the repressor, in the same units as `effector_conc`.
+    ep_ai : float or array
+        The energetic difference between the active and inactive states of
+        the repressor in units of kT.
+    n_sites : int or array
+        The number of effector binding sites per repressor. Default is 2.
+        Need not be an integer.
+    dtype : numpy dtype or None
+        If given, all inputs are cast to this type before evaluation.
+
+    Returns
+    -------
+    pact : float or array
+        The probability of the repressor being active, broadcast over all
+        inputs.
+    """
+    effector_conc, ka, ki, ep_ai, n_sites = _cast(dtype, effector_conc, ka, ki,
+                                                  ep_ai, n_sites)
+    numer = (1 + effector_conc / ka)**n_sites
+    denom = numer + np.exp(-ep_ai) * (1 + effector_conc / ki)**n_sites
+    return numer / denom
+
+
+def log_pact(effector_conc, ka, ki, ep_ai, n_sites=2, dtype=None):
+    """
+    Computes the natural logarithm of the probability that a repressor is
+    active, remaining finite and accurate where p_act underflows. Parameters
+    are as in `pact`.
+    """
+    effector_conc, ka, ki, ep_ai, n_sites = _cast(dtype, effector_conc, ka, ki,
+                                                  ep_ai, n_sites)
+    # log pact = -log(1 + exp(z)) with z the inactive-active free energy.
+    z = -ep_ai + n_sites * (np.log1p(effector_conc / ki) -
+                            np.log1p(effector_conc / ka))
+    return -np.logaddexp(0, z)
+
+
+def fold_change(effector_conc, R, ep_r, ka, ki, ep_ai, n_sites=2, n_ns=4.6E6,
+                log_space=False, dtype=None):
+    """
+    Computes the fold-change in gene expression for the simple repression
+    motif with an allosteric repressor.
+
+    Parameters
+    ----------
+    effector_conc : float or array
+        The concentration of the effector molecule.
+    R : float or array
+        The number of repressors per cell.
+    ep_r : float or array
+        The repressor-DNA binding energy in units of kT.
+    ka, ki, ep_ai, n_sites :
+        Allosteric parameters. See `pact` for details.
+    n_ns : float or array
+        The number of nonspecific binding sites. Default is 4.6E6, the length
+        of the E. coli genome.
+    log_space : bool
+        If True, compute through the Bohr parameter in log space. This is
+        accurate for extreme energies and copy numbers and is recommended
+        with `dtype=np.float32`.
+    dtype : numpy dtype or None
+        If given, all inputs are cast to this type before evaluation.
+
+    Returns
+    -------
+    fold_change : float or array
+        The fold-change in gene expression, broadcast over all inputs.
+    """
+    if log_space:
+        return master_curve(bohr_parameter(effector_conc, R, ep_r, ka, ki,
+                                           ep_ai, n_sites, n_ns, dtype))
+    effector_conc, R, ep_r, ka, ki, ep_ai, n_sites, n_ns = _cast(
+        dtype, effector_conc, R, ep_r, ka, ki, ep_ai, n_sites, n_ns)
+    p = pact(effector_conc, ka, ki, ep_ai, n_sites)
+    return (1 + p * (R / n_ns) * np.exp(-ep_r))**-1
+
+
+def bohr_parameter(effector_conc, R, ep_r, ka, ki, ep_ai, n_sites=2,
+                   n_ns=4.6E6, dtype=None):
+    """
+    Computes the Bohr parameter (the effective free energy) of the simple
+    repression motif. Parameters are as in `fold_change`.
+
+    The calculation goes through `log_pact`, so the result stays finite when
+    p_act itself would underflow.
+
+    Returns
+    -------
+    bohr : float or array
+        The Bohr parameter in units of kT, defined such that the fold-change
+        is given by (1 + exp(-bohr))^-1.
+    """
+    effector_conc, R, ep_r, ka, ki, ep_ai, n_sites, n_ns = _cast(
+        dtype, effector_conc, R, ep_r, ka, ki, ep_ai, n_sites, n_ns)
+    log_p = log_pact(effector_conc, ka, ki, ep_ai, n_sites)
+    return -log_p - np.log(R / n_ns) + ep_r
+
+
+def delta_bohr(effector_conc, ka, ki, ep_ai, ka_ref, ki_ref, ep_ai_ref,
+               n_sites=2, dtype=None):
+    """
+    Computes the free energy shift of an allosteric mutant relative to a
+    reference repressor with the same copy number and DNA binding energy,
+    log p_act(reference) - log p_act(mutant).
+
+    Parameters
+    ----------
+    effector_conc : float or array
+        The concentration of the effector molecule.
+    ka, ki, ep_ai : float or array
+        Allosteric parameters of the mutant. See `pact` for details.
+    ka_ref, ki_ref, ep_ai_ref : float or array
+        Allosteric parameters of the reference, typically the wild type.
+    n_sites : int or array
+        The number of effector binding sites per repressor. Default is 2.
+    dtype : numpy dtype or None
+        If given, all inputs are cast to this type before evaluation.
+
+    Returns
+    -------
+    delta_bohr : float or array
+        The shift of the Bohr parameter in units of kT.
+    """
+    log_p_ref = log_pact(effector_conc, ka_ref, ki_ref, ep_ai_ref, n_sites,
+                         dtype)
+    return log_p_ref - log_pact(effector_conc, ka, ki, ep_ai, n_sites, dtype)
+
+
+def master_curve(bohr):
+    """
+    Computes the fold-change (1 + exp(-bohr))^-1 for a given Bohr parameter
+    without overflow at large negative free energies and with full relative
+    precision at small fold-changes.
+    """
+    return np.exp(-np.logaddexp(0, -bohr))
+
+
+def evaluate(effector_conc, R, ep_r, ka, ki, ep_ai, n_sites=2, n_ns=4.6E6,
+             ref_bohr=None, log_space=False, dtype=None):
+    """
+    Computes the probability of an active repressor, the fold-change and the
+    Bohr parameter together, evaluating p_act only once.
+
+    Parameters are as in `fold_change`, with the addition of
+
+    ref_bohr : float, array, or None
+        The Bohr parameter of a reference state. If provided, the free
+        energy shift relative to it is also returned.
+
+    Returns
+    -------
+    out : dict
+        Dictionary with keys `pact`, `fold_change`, `bohr_parameter` and,
+        if `ref_bohr` is given, `delta_bohr`.
+    """
+    effector_conc, R, ep_r, ka, ki, ep_ai, n_sites, n_ns = _cast(
+        dtype, effector_conc, R, ep_r, ka, ki, ep_ai, n_sites, n_ns)
+    if log_space:
+        log_p = log_pact(effector_conc, ka, ki, ep_ai, n_sites)
+        bohr = -log_p - np.log(R / n_ns) + ep_r
+        out = {'pact': np.exp(log_p), 'fold_change': master_curve(bohr),
+               'bohr_parameter': bohr}
+    else:
+        p = pact(effector_conc, ka, ki, ep_ai, n_sites)
+
+        # The fold-change is (1 + x)^-1 and the Bohr parameter is -log(x).
+        x = p * (R / n_ns) * np.exp(-ep_r)
+        bohr = -np.log(x)
+        out = {'pact': p, 'fold_change': 1 / (1 + x), 'bohr_parameter': bohr}
+    if ref_bohr is not None:
+        out['delta_bohr'] = bohr - ref_bohr
+    return out
+
+
+def bohr_gradient(effector_conc, R, ep_r, ka, ki, ep_ai, n_sites=2,
+                  n_ns=4.6E6):
+    """
+    Computes the analytic derivatives of the Bohr parameter with respect to
+    each parameter in `GRADIENT_PARAMS`. Parameters are as in `fold_change`.
+
+    Returns
+    -------
+    grad : array
+        The derivatives stacked along the first axis in the order of
+        `GRADIENT_PARAMS`, with the remaining axes broadcast over all inputs.
+    """
+    effector_conc, R, ep_r, ka, ki, ep_ai, n_sites, n_ns = np.broadcast_arrays(
+        effector_conc, R, ep_r, ka, ki, ep_ai, n_sites, n_ns)
+
+    # With log pact = -log(1 + exp(z)), every term goes through
+    # d(-log pact)/dz = 1 - pact, evaluated without cancellation.
+    z = -ep_ai + n_sites * (np.log1p(effector_conc / ki) -
+                            np.log1p(effector_conc / ka))
+    q = master_curve(z)
+    dz_dka = n_sites * effector_conc / (ka * (ka + effector_conc))
+    dz_dki = -n_sites * effector_conc / (ki * (ki + effector_conc))
+    dz_dc = n_sites * (1 / (ki + effector_conc) - 1 / (ka + effector_conc))
+    return np.stack([-1 / R, np.ones_like(q), q * dz_dka, q * dz_dki, -q,
+                     q * dz_dc])
+
+
+def fold_change_gradient(effector_conc, R, ep_r, ka, ki, ep_ai, n_sites=2,
+                         n_ns=4.6E6):
+    """
+    Computes the analytic derivatives of the fold-change with respect to
+    each parameter in `GRADIENT_PARAMS`. Parameters and output are as in
+    `bohr_gradient`.
+    """
+    bohr = bohr_parameter(effector_conc, R, ep_r, ka, ki, ep_ai, n_sites, n_ns)
+    dfc_dbohr = master_curve(bohr) * master_curve(-bohr)
+    return dfc_dbohr * bohr_gradient(effector_conc, R, ep_r, ka, ki, ep_ai,
+                                     n_sites, n_ns)
+
+
+def saturation(R, ep_r, ka, ki, ep_ai, n_sites=2, n_ns=4.6E6):
+    """
+    Computes the fold-change at saturating effector concentration.
+    Parameters are as in `fold_change`.
+    """
+    pact_inf = 1 / (1 + np.exp(-ep_ai) * (ka / ki)**n_sites)
+    return 1 / (1 + pact_inf * (R / n_ns) * np.exp(-ep_r))
+
+
+def leakiness(R, ep_r, ka, ki, ep_ai, n_sites=2, n_ns=4.6E6):
+    """
+    Computes the fold-change in the absence of effector. Parameters are as
+    in `fold_change`.
+    """
+    return fold_change(0, R, ep_r, ka, ki, ep_ai, n_sites, n_ns)
+
+
+def dynamic_range(R, ep_r, ka, ki, ep_ai, n_sites=2, n_ns=4.6E6):
+    """
+    Computes the difference between the saturation and the leakiness.
+    Parameters are as in `fold_change`.
+    """
+    return (saturation(R, ep_r, ka, ki, ep_ai, n_sites, n_ns) -
+            leakiness(R, ep_r, ka, ki, ep_ai, n_sites, n_ns))
+
+
+def ec50(R, ep_r, ka, ki, ep_ai, n_sites=2, n_ns=4.6E6):
+    """
+    Computes the effector concentration at which the fold-change is halfway
+    between the leakiness and the saturation. Parameters are as in
+    `fold_change` and may be arrays of any broadcastable shape.
+    """
+    return compute_properties(R, ep_r, ka, ki, ep_ai, n_sites, n_ns)['EC50']
+
+
+def effective_hill(R, ep_r, ka, ki, ep_ai, n_sites=2, n_ns=4.6E6):
+    """
+    Computes the effective Hill coefficient, twice the log-log slope of the
+    normalized fold-change at the EC50. Parameters are as in `fold_change`
+    and may be arrays of any broadcastable shape.
+    """
+    props = compute_properties(R, ep_r, ka, ki, ep_ai, n_sites, n_ns)
+    return props['effective_hill']
+
+
+def compute_properties(R, ep_r, ka, ki, ep_ai, n_sites=2, n_ns=4.6E6):
+    """
+    Computes the leakiness, saturation, dynamic range, EC50 and effective
+    Hill coefficient of the induction profile in closed form.
+
+    This is the vectorized counterpart of
+    `phd.thermo.SimpleRepression.compute_properties`. No root finding is
+    involved, so every parameter may be an array of any broadcastable shape,
+    such as a (n_R, 1) column of copy numbers against (n_samples,) posterior
+    samples.
+
+    Parameters are as in `fold_change`.
+
+    Returns
+    -------
+    props : dict
+        Dictionary with keys `leakiness`, `saturation`, `dynamic_range`,
+        `EC50` and `effective_hill`, all with the broadcast shape of the
+        parameters.
+    """
+    k = (R / n_ns) * np.exp(-ep_r)
+    boltz = np.exp(-ep_ai)
+    leak = 1 / (1 + k / (1 + boltz))
+    sat = 1 / (1 + k / (1 + boltz * (ka / ki)**n_sites))
+
+    # Invert the fold-change at the midpoint. With g = (1 + c/ki)/(1 + c/ka),
+    # pact = (1 + boltz * g^n)^-1, so g is found directly and then c.
+    fc_50 = 0.5 * (leak + sat)
+    pact_50 = (1 / fc_50 - 1) / k
+    g_n = (1 / pact_50 - 1) / boltz
+    g = g_n**(1 / n_sites)
+    ec50 = ka * ki * (g - 1) / (ka - g * ki)
+
+    # d(fc)/dc at the EC50 by the chain rule through pact and g.
+    dg = (1 / ki - 1 / ka) / (1 + ec50 / ka)**2
+    dpact = -pact_50**2 * boltz * n_sites * (g_n / g) * dg
+    dfc = -k * dpact * fc_50**2
+    hill = 4 * ec50 * dfc / (sat - leak)
+
+    # The leakiness does not depend on the allosteric constants, so bring it
+    # to the common shape of the other properties.
+    leak, sat, ec50, hill = np.broadcast_arrays(leak, sat, ec50, hill)
+    return {'leakiness': leak, 'saturation': sat, 'dynamic_range': sat - leak,
+            'EC50': ec50, 'effective_hill': hill}
+
+
+def _cast(dtype, *args):
+    """Casts each argument to `dtype`, or returns them unchanged if None."""
+    if dtype is None:
+        return args
+    return tuple(np.asarray(a, dtype=dtype) for a in args)
@@ -0,0 +1,15 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def chain():
+    """A synthetic posterior chain of the allosteric constants."""
+    rng = np.random.default_rng(42)
+    return {'ka': 139 * np.exp(rng.normal(0, 0.2, 2000)),
+            'ki': 0.53 * np.exp(rng.normal(0, 0.2, 2000))}
+
+
+@pytest.fixture
+def c_grid():
+    return np.logspace(-2, 4, 57)
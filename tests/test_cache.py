@@ -0,0 +1,35 @@
+import functools
+import numpy as np
+from talktools import cache, thermo
+
+
+def _model(**kwargs):
+    return functools.partial(thermo.fold_change, ep_r=-13.9, ep_ai=4.5,
+                             **kwargs)
+
+
+def test_band_key_separates_scalar_and_list_mass(chain, c_grid):
+    assert cache.band_key(_model(R=260), chain, c_grid, 0.95) != \
+        cache.band_key(_model(R=260), chain, c_grid, [0.95])
+
+
+def test_band_key_separates_dtype(chain, c_grid):
+    assert cache.band_key(_model(R=260), chain, c_grid, 0.95) != \
+        cache.band_key(_model(R=260), chain, c_grid, 0.95, np.float32)
+
+
+def test_band_key_normalizes_numeric_scalars(chain, c_grid):
+    keys = {cache.band_key(_model(R=r), chain, c_grid, 0.95)
+            for r in [260, 260.0, np.int64(260)]}
+    assert len(keys) == 1
+
+
+def test_cached_credible_band_shapes(tmp_path, chain, c_grid):
+    bands = cache.BandCache(str(tmp_path))
+    scalar = cache.cached_credible_band(_model(R=260), chain, c_grid, 0.95,
+                                        cache=bands)
+    listed = cache.cached_credible_band(_model(R=260), chain, c_grid, [0.95],
+                                        cache=bands)
+    assert scalar.shape == (2, len(c_grid))
+    assert listed.shape == (1, 2, len(c_grid))
+    np.testing.assert_array_equal(listed[0], scalar)
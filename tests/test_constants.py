@@ -0,0 +1,19 @@
+import copy
+import pickle
+import pytest
+from talktools import constants
+
+
+def test_constants_roundtrip():
+    c = constants.load_constants(Oid=-17.3)
+    for other in [pickle.loads(pickle.dumps(c)), copy.deepcopy(c)]:
+        assert dict(other) == dict(c)
+        assert other.version == c.version
+
+
+def test_constants_are_read_only():
+    c = constants.load_constants()
+    with pytest.raises(TypeError):
+        c.Ka = 1
+    with pytest.raises(AttributeError):
+        c._missing
@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+from talktools import parallel
+
+
+def _write(key, chain):
+    chain['ka'][0] = key
+
+
+def _total(key, chain):
+    return key + chain['ka'].sum()
+
+
+def test_map_groups_serial_chain_is_read_only():
+    ka = np.ones(4)
+    with pytest.raises(ValueError):
+        parallel.map_groups(_write, [1], {'ka': ka}, processes=1)
+    assert ka.flags.writeable
+
+
+def test_map_groups_preserves_order():
+    out = parallel.map_groups(_total, [3, 1, 2], {'ka': np.ones(4)},
+                              processes=2)
+    assert out == [7, 5, 6]
@@ -0,0 +1,47 @@
+import functools
+import numpy as np
+import pytest
+from talktools import predictions, stats, thermo
+
+REPS = np.array([22, 260, 1740])
+ENERGIES = {'O1': -15.3, 'O2': -13.9, 'O3': -9.7}
+
+
+def test_repression_bands_match_credible_band(chain, c_grid):
+    bands = predictions.repression_bands(c_grid, chain, REPS,
+                                         list(ENERGIES.values()), 0.95,
+                                         ep_ai=4.5)
+    assert bands.shape == (len(REPS), len(ENERGIES), 2, len(c_grid))
+    for i, r in enumerate(REPS):
+        for j, ep_r in enumerate(ENERGIES.values()):
+            model = functools.partial(thermo.fold_change, R=r, ep_r=ep_r,
+                                      ep_ai=4.5)
+            band = stats.credible_band(model, chain, c_grid, 0.95)
+            np.testing.assert_allclose(bands[i, j], band, rtol=1e-12,
+                                       atol=1e-15)
+
+
+def test_repression_bands_chunked_matches_unchunked(chain, c_grid):
+    args = (c_grid, chain, REPS, list(ENERGIES.values()), 0.95)
+    full = predictions.repression_bands(*args, ep_ai=4.5)
+    chunked = predictions.repression_bands(*args, ep_ai=4.5, max_bytes=1)
+    np.testing.assert_array_equal(chunked, full)
+
+
+def test_repression_bands_rejects_array_n_ns(chain, c_grid):
+    with pytest.raises(ValueError):
+        predictions.repression_bands(c_grid, chain, REPS, [-13.9],
+                                     ep_ai=4.5, n_ns=np.array([4.6E6, 1E6]))
+
+
+@pytest.mark.parametrize('kwargs', [{'dtype': np.float32},
+                                    {'log_space': True},
+                                    {'log_space': True, 'dtype': np.float32}])
+def test_induction_table_options(chain, c_grid, kwargs):
+    ref = predictions.induction_table(ENERGIES, REPS, c_grid, chain,
+                                      ep_ai=4.5)
+    df = predictions.induction_table(ENERGIES, REPS, c_grid, chain,
+                                     ep_ai=4.5, **kwargs)
+    assert len(df) == len(ENERGIES) * len(REPS) * len(c_grid)
+    np.testing.assert_allclose(df[['fc_min', 'fc_max']].values,
+                               ref[['fc_min', 'fc_max']].values, atol=1e-5)
@@ -0,0 +1,51 @@
+import functools
+import numpy as np
+import pytest
+from talktools import stats, thermo
+
+
+def _model():
+    return functools.partial(thermo.fold_change, R=260, ep_r=-13.9,
+                             ep_ai=4.5)
+
+
+def test_credible_band_matches_per_concentration_hpd(chain, c_grid):
+    band = stats.credible_band(_model(), chain, c_grid, 0.95)
+    for i, c in enumerate(c_grid):
+        fc = _model()(c, **chain)
+        np.testing.assert_array_equal(band[:, i], stats.compute_hpd(fc, 0.95))
+
+
+@pytest.mark.parametrize('max_bytes', [1, 2**16, 2**20])
+def test_credible_band_chunked_matches_unchunked(chain, c_grid, max_bytes):
+    full = stats.credible_band(_model(), chain, c_grid, [0.5, 0.95])
+    chunked = stats.credible_band(_model(), chain, c_grid, [0.5, 0.95],
+                                  max_bytes=max_bytes)
+    np.testing.assert_array_equal(chunked, full)
+
+
+def test_credible_band_shapes(chain, c_grid):
+    assert stats.credible_band(_model(), chain, c_grid, 0.95).shape == \
+        (2, len(c_grid))
+    assert stats.credible_band(_model(), chain, c_grid, [0.95]).shape == \
+        (1, 2, len(c_grid))
+
+
+def test_compute_hpd_full_mass_is_sample_range():
+    x = np.random.default_rng(0).normal(size=(3, 500))
+    hpd = stats.compute_hpd(x, 1.0, axis=1)
+    np.testing.assert_array_equal(hpd, [x.min(axis=1), x.max(axis=1)])
+
+
+@pytest.mark.parametrize('mass_frac', [0, -0.1, 1.5])
+def test_compute_hpd_rejects_invalid_mass(mass_frac):
+    with pytest.raises(ValueError):
+        stats.compute_hpd(np.arange(10.), mass_frac)
+
+
+def test_compute_hpd_contains_mass():
+    x = np.random.default_rng(1).normal(size=10000)
+    lo, hi = stats.compute_hpd(x, 0.95)
+    assert np.mean((x >= lo) & (x <= hi)) >= 0.95
+    # The HPD of a symmetric distribution is close to the central interval.
+    np.testing.assert_allclose([lo, hi], [-1.96, 1.96], atol=0.1)
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from scipy.optimize import brentq
+from talktools import thermo
+
+PARAMS = {'R': 260., 'ep_r': -13.9, 'ka': 139., 'ki': 0.53, 'ep_ai': 4.5}
+
+
+@pytest.mark.parametrize('R, ep_r', [(22, -15.3), (260, -13.9),
+                                     (1740, -9.7)])
+def test_ec50_matches_root_finding(R, ep_r):
+    params = dict(PARAMS, R=R, ep_r=ep_r)
+    props = thermo.compute_properties(**params)
+    target = 0.5 * (props['leakiness'] + props['saturation'])
+    log_c = brentq(lambda x: thermo.fold_change(10**x, **params) - target,
+                   -6, 6, xtol=1e-14)
+    np.testing.assert_allclose(props['EC50'], 10**log_c, rtol=1e-8)
+
+
+def test_effective_hill_matches_finite_difference():
+    props = thermo.compute_properties(**PARAMS)
+    ec50, h = props['EC50'], 1e-6
+    norm = (lambda c: (thermo.fold_change(c, **PARAMS) - props['leakiness']) /
+            props['dynamic_range'])
+    slope = (np.log(norm(ec50 * np.exp(h))) -
+             np.log(norm(ec50 * np.exp(-h)))) / (2 * h)
+    np.testing.assert_allclose(props['effective_hill'], 2 * slope, rtol=1e-6)
+
+
+def test_compute_properties_shapes():
+    R = np.array([22., 260., 1740.])[:, np.newaxis]
+    ka = np.full(5, 139.)
+    props = thermo.compute_properties(R, -13.9, ka, 0.53, 4.5)
+    for v in props.values():
+        assert v.shape == (3, 5)
+
+
+@pytest.mark.parametrize('c', [0.1, 10., 1000.])
+def test_fold_change_gradient_matches_finite_difference(c):
+    values = dict(PARAMS, effector_conc=c)
+    grad = thermo.fold_change_gradient(**values)
+    for i, p in enumerate(thermo.GRADIENT_PARAMS):
+        h = 1e-6 * max(abs(values[p]), 1)
+        up = thermo.fold_change(**dict(values, **{p: values[p] + h}))
+        down = thermo.fold_change(**dict(values, **{p: values[p] - h}))
+        np.testing.assert_allclose(grad[i], (up - down) / (2 * h),
+                                   rtol=1e-6, atol=1e-12, err_msg=p)
+
+
+def test_bohr_gradient_broadcasts_array_n_sites():
+    grad = thermo.bohr_gradient(1., n_sites=np.array([1, 2, 3]), **PARAMS)
+    assert grad.shape == (len(thermo.GRADIENT_PARAMS), 3)
+
+
+def test_log_space_matches_linear():
+    c = np.logspace(-2, 4, 50)
+    np.testing.assert_allclose(thermo.fold_change(c, log_space=True, **PARAMS),
+                               thermo.fold_change(c, **PARAMS), rtol=1e-12)